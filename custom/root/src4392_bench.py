@@ -0,0 +1,301 @@
+#!/bin/python3
+# benchmarks of src4392.py against the emulated chips, results as JSON so runs of
+# different releases can be compared
+from typing import List, Dict
+import argparse
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import src4392_lib as src
+
+SCRIPT = os.path.join(src.SCHEMA_DIR, "src4392.py")
+CACHE_MODES = { "cached": True, "uncached": False }
+FULL_PLAN = src.BurstPlan({ page: [ src.PAGE_SPAN[page] ] for page in src.SCHEMA_PAGES })
+
+def median(vals:List[float]) -> float:
+    return sorted(vals)[len(vals) // 2]
+
+def us(seconds:float, count:int=1) -> float:
+    return round(seconds * 1e6 / count, 2)
+
+def emulate(byte_time:float):
+    # new emulated chips, and no page, shadow or decode state left from an earlier run
+    src.EMULATED_BUSES.clear()
+    for info in src.channel_registry()["channels"].values():
+        if info["dev"] not in src.EMULATED_BUSES:
+            src.EMULATED_BUSES[info["dev"]] = src.EmulatedI2C(info["dev"], byte_time)
+    src.REPLAYS.clear()
+    src.SRC4392.selected_page.clear()
+    src.SRC4392.shadows.clear()
+    src.SRC4392.dirties.clear()
+    src.SRC4392.decode_caches.clear()
+
+def record_replay(chans:List[str], path:str):
+    # two uncached full snapshots of every channel, replayed by the "replay" transport
+    src.TRACE_LOGS.clear()
+    for chan in chans:
+        ch = src.channel(chan)
+        bus = src.TraceTransport(src.EmulatorTransport(ch.dev), path)
+        try:
+            dev = src.SRC4392(bus, ch.address, cache=False)
+            for i in range(2):
+                dev.read_plan(FULL_PLAN)
+            dev.select_page(0)
+        finally:
+            bus.close()
+    src.REPLAY_PATH = path
+
+def open_chip(chan:str, kind:str, cache:bool, stats:src.Stats=None) -> src.SRC4392:
+    ch = src.channel(chan)
+    bus = src.TRANSPORTS[kind](ch.dev)
+    if stats is not None:
+        bus = src.StatsTransport(bus, stats)
+    return src.SRC4392(bus, ch.address, cache=cache)
+
+def cold_start(runs:int) -> Dict:
+    # fresh processes dumping the first channel from the emulator, with an empty and a
+    # filled schema cache
+    with tempfile.TemporaryDirectory() as cache:
+        env = dict(os.environ, SRC4392_CACHE=cache, SRC4392_EMU_BYTE_US="0")
+        for name in [ "SRC4392_TRACE", "SRC4392_REPLAY", "SRC4392_STATS" ]:
+            env.pop(name, None)
+
+        def run(cmd:List[str]) -> float:
+            t0 = time.perf_counter()
+            subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, check=True)
+            return time.perf_counter() - t0
+
+        dump = [ sys.executable, SCRIPT, src.channel_names()[0], "--transport", "emulator" ]
+        interpreter = [ run([ sys.executable, "-c", "pass" ]) for i in range(runs) ]
+        cold = []
+        for i in range(runs):
+            for name in os.listdir(cache):
+                os.remove(os.path.join(cache, name))
+            cold.append(run(dump))
+            if len(os.listdir(cache)) == 0:
+                raise RuntimeError("the dump did not compile the schema cache, cold start not measured")
+        warm = [ run(dump) for i in range(runs) ]
+    return {
+        "runs": runs,
+        "interpreter_ms": round(median(interpreter) * 1e3, 1),
+        "no_schema_cache_ms": round(median(cold) * 1e3, 1),
+        "schema_cache_ms": round(median(warm) * 1e3, 1),
+    }
+
+def bus_counts(bus:src.BusStats) -> Dict:
+    return { "transfers": bus.transfers, "bytes": bus.bytes_read + bus.bytes_written, "page_switches": bus.page_switches }
+
+def transactions(chan:str, kind:str, cache:bool) -> Dict:
+    # bus traffic of the first and of a repeated full snapshot and channel profile read
+    result = {}
+    for name, plan in [ ("full", FULL_PLAN), ("profile", src.channel(chan).plan()) ]:
+        emulate(0)
+        stats = src.Stats()
+        dev = open_chip(chan, kind, cache, stats)
+        bus = stats.bus(dev.transport.devpath)
+        try:
+            for run in [ "first", "repeat" ]:
+                before = bus_counts(bus)
+                dev.read_plan(plan)
+                after = bus_counts(bus)
+                result[name + "_" + run] = { key: after[key] - before[key] for key in after }
+        finally:
+            dev.transport.close()
+    return result
+
+def snapshot_rate(chans:List[str], kind:str, cache:bool, count:int, byte_time:float) -> Dict:
+    # full snapshots per second of each channel alone, then of all channels, one thread per bus
+    result = {}
+    for chan in chans:
+        emulate(byte_time)
+        dev = open_chip(chan, kind, cache)
+        try:
+            t0 = time.perf_counter()
+            c0 = time.process_time()
+            for i in range(count):
+                dev.read_plan(FULL_PLAN)
+            cpu = time.process_time() - c0
+            wall = time.perf_counter() - t0
+        finally:
+            dev.transport.close()
+        result[chan] = { "per_s": round(count / wall, 1), "wall_us": us(wall, count), "cpu_us": us(cpu, count) }
+
+    def scan(chan:str) -> Dict:
+        dev = open_chip(chan, kind, cache)
+        try:
+            for i in range(count):
+                dev.read_plan(FULL_PLAN)
+        finally:
+            dev.transport.close()
+        return {}
+
+    emulate(byte_time)
+    t0 = time.perf_counter()
+    c0 = time.process_time()
+    errors = [ info["error"] for info in src.scan_channels(chans, scan=scan).values() if "error" in info ]
+    cpu = time.process_time() - c0
+    wall = time.perf_counter() - t0
+    total = count * len(chans)
+    result["ALL"] = { "per_s": round(total / wall, 1), "wall_us": us(wall, total), "cpu_us": us(cpu, total) }
+    if len(errors) > 0:
+        result["ALL"]["errors"] = errors
+    return result
+
+def decode_timing(count:int) -> Dict:
+    # per register: compiling and decoding (reg_decode), decoding a new value, and a value
+    # seen before (lookup table); per page: re-decoding an unchanged and a one byte change
+    emulate(0)
+    dev = open_chip(src.channel_names()[0], "emulator", False)
+    snaps = dev.snapshots(src.SCHEMA_PAGES)
+    dev.transport.close()
+    result = {}
+    for page, snap in snaps.items():
+        # the page select register is not part of the snapshot
+        regs = [ (info, decoder) for info, decoder in zip(src.page_regs(page), src.page_decoders(page)) if decoder.regs != (0x7F,) ]
+        values = [ (decoder, snap.reg_value(decoder.regs)) for info, decoder in regs ]
+        raw = [ (info, snap.reg_value(decoder.regs)) for info, decoder in regs ]
+        n = count * len(values)
+
+        t0 = time.perf_counter()
+        for i in range(count):
+            for info, val in raw:
+                src.reg_decode(info, val)
+        reg_decode = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for i in range(count):
+            for decoder, val in values:
+                decoder.decode_value(val)
+        decode_value = time.perf_counter() - t0
+
+        for decoder, val in values:
+            decoder.decode(val)
+        t0 = time.perf_counter()
+        for i in range(count):
+            for decoder, val in values:
+                decoder.decode(val)
+        decode_seen = time.perf_counter() - t0
+
+        cache = src.DecodeCache(page)
+        cache.update(snap)
+        changed = src.PageSnapshot(page, bytes(snap.data))
+        changed.data[0] ^= 0x01
+        t0 = time.perf_counter()
+        for i in range(count):
+            cache.update(snap)
+        unchanged = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for i in range(count):
+            cache.update(changed if i % 2 == 0 else snap)
+        one_byte = time.perf_counter() - t0
+
+        result["page%d" % page] = {
+            "registers": len(values),
+            "reg_decode_us": us(reg_decode, n),
+            "decode_new_us": us(decode_value, n),
+            "decode_seen_us": us(decode_seen, n),
+            "redecode_unchanged_page_us": us(unchanged, count),
+            "redecode_one_byte_page_us": us(one_byte, count),
+        }
+    return result
+
+def poll_allocations(chan:str, count:int) -> Dict:
+    # memory of one SRC4392.poll of the channel profile: the peak while polling, the
+    # blocks its result holds, and the blocks left behind once the result is dropped
+    emulate(0)
+    dev = open_chip(chan, "emulator", True)
+    plan = src.channel(chan).plan()
+    try:
+        for i in range(10):
+            dev.poll(plan)
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            blocks = sys.getallocatedblocks()
+            result = dev.poll(plan)
+            held = sys.getallocatedblocks() - blocks
+            peak = tracemalloc.get_traced_memory()[1] - base
+            del result
+            blocks = sys.getallocatedblocks()
+            for i in range(count):
+                dev.poll(plan)
+            retained = sys.getallocatedblocks() - blocks
+        finally:
+            tracemalloc.stop()
+    finally:
+        dev.transport.close()
+    return {
+        "polls": count,
+        "peak_bytes": peak,
+        "result_blocks": held,
+        "retained_blocks_per_poll": round(retained / count, 2),
+    }
+
+def script_hash() -> str:
+    # the library, the command line script only imports it
+    with open(src.__file__, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:8]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark src4392.py on the emulated chips")
+    parser.add_argument("--count", type=int, default=20,
+                        help="snapshots per channel and decode iterations")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="processes started per cold start measurement")
+    parser.add_argument("--byte-us", type=float, default=round(src.EMULATOR_BYTE_TIME * 1e6, 3),
+                        help="emulated bus time per byte for the snapshot rates, 0 to measure the CPU cost only")
+    parser.add_argument("--transports", default="emulator,replay",
+                        help="comma separated transports compared; periphery and rdwr need the hardware")
+    parser.add_argument("--out", metavar="FILE",
+                        help="write the results to FILE instead of stdout")
+    args = parser.parse_args()
+    kinds = args.transports.split(",")
+    for kind in kinds:
+        if kind not in src.TRANSPORTS:
+            print("Unknown transport")
+            sys.exit()
+    byte_time = args.byte_us * 1e-6
+    chans = src.channel_names()
+
+    results = {
+        "meta": {
+            "script": script_hash(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "count": args.count,
+            "byte_us": args.byte_us,
+        },
+        "cold_start": cold_start(args.runs),
+        "transactions": {},
+        "snapshot_rate": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in kinds:
+            if kind == "replay":
+                emulate(0)
+                record_replay(chans, os.path.join(tmp, "bench.trace"))
+            results["transactions"][kind] = {}
+            results["snapshot_rate"][kind] = {}
+            for mode, cache in CACHE_MODES.items():
+                try:
+                    results["transactions"][kind][mode] = transactions(chans[0], kind, cache)
+                    results["snapshot_rate"][kind][mode] = snapshot_rate(chans, kind, cache, args.count, byte_time)
+                except IOError as e:
+                    results["transactions"][kind][mode] = { "error": str(e) }
+                    results["snapshot_rate"][kind][mode] = { "error": str(e) }
+    results["decode"] = decode_timing(args.count * 50)
+    results["poll_allocations"] = poll_allocations(chans[0], args.count)
+
+    if args.out is not None:
+        with open(args.out, "w") as f:
+            f.write(json.dumps(results, indent=4) + "\n")
+    else:
+        src.pdict(results)
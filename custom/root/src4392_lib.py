@@ -0,0 +1,2444 @@
+# SRC4392 register access, decoding and monitoring, imported by the src4392.py command line
+# so its bytecode is cached; modules only some commands need are imported where used
+from typing import List, Tuple, Dict, Iterator
+import bisect
+import errno
+import fcntl
+import json
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+
+REG_FIELD={
+    "bits": [ 0 ],       # low to high
+    "value": 0,
+    "default": 0,
+    "choices": [ "OFF", "ON" ]
+}
+REG={   "name": "0x",
+        "regs": [ 0 ],  # low to high
+        "desc": "",
+        "volatile": False,  # status register, never served from the shadow cache
+        "fields": {
+            "field_name": REG_FIELD
+        }
+}
+
+# register tables, one JSON file per page next to this script, loaded when a page is first used
+SCHEMA_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_PAGES = [ 0, 1, 2 ]
+
+def json_default(obj):
+    # lazy register views are decoded only when serialized
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError("not JSON serializable: " + type(obj).__name__)
+
+def pdict(json_object:dict):
+    with profile("serialize"):
+        text = json.dumps(json_object, indent=4, default=json_default)
+    print(text)
+
+def i2c_reg_read(i2c:"I2C", address:int, reg:int) -> int:
+    msg_reg = [ i2c.Message([ reg ]) ]
+    msg_read = [i2c.Message([ 0x00 ], read=True) ]
+    i2c.transfer(address, msg_reg)
+    i2c.transfer(address, msg_read)
+    return msg_read[0].data[0]
+
+def i2c_reg_write(i2c:"I2C", address:int, reg:int, val:int) -> int:
+    msg_reg_write = [ i2c.Message([ reg, val ]) ]
+    i2c.transfer(address, msg_reg_write)
+    return
+
+def i2c_reg_write_bursts(i2c:"I2C", address:int, bursts:List[Tuple[int, List[int]]]):
+    # every (reg_first, values) burst is one auto-increment message of a single I2C_RDWR
+    # transfer, repeated starts between them and one stop at the end
+    i2c.transfer(address, [ i2c.Message([ reg_first ] + list(vals)) for reg_first, vals in bursts ])
+
+def i2c_reg_read_burst(i2c:"I2C", address:int, reg_first:int, count:int) -> List[int]:
+    # register address write, repeated start and count byte read in one I2C_RDWR transfer;
+    # the SRC4392 auto-increments the register address after each byte (INC, bit 7 of the address byte, clear)
+    msgs = [ i2c.Message([ reg_first & 0x7F ]), i2c.Message([ 0x00 ] * count, read=True) ]
+    i2c.transfer(address, msgs)
+    return list(msgs[1].data)
+
+def i2c_reg_read_multi(i2c:"I2C", address:int, reg_first:int, reg_last:int) -> List[int]:
+    return i2c_reg_read_burst(i2c, address, reg_first, reg_last-reg_first+1)
+
+# a new burst costs about 3 bytes on the wire (address, register, address) so reading
+# through a gap up to that size is cheaper than starting another transfer
+BURST_MAX_GAP = 3
+
+def reg_bursts(regs:List[int], max_gap:int=BURST_MAX_GAP) -> List[Tuple[int, int]]:
+    bursts = []
+    for reg in sorted(set(regs)):
+        if len(bursts) > 0 and reg - bursts[-1][1] <= max_gap + 1:
+            bursts[-1] = (bursts[-1][0], reg)
+        else:
+            bursts.append((reg, reg))
+    return bursts
+
+class PeripheryTransport:
+    # python-periphery I2C, builds and marshals new messages for every transfer; periphery
+    # is imported on first use, emulated and replayed runs never need it
+    def __init__(self, dev:str):
+        from periphery import I2C
+        self.devpath = dev
+        self.i2c = I2C(dev)
+
+    def read(self, address:int, reg:int) -> int:
+        return i2c_reg_read(self.i2c, address, reg)
+
+    def write(self, address:int, reg:int, val:int):
+        i2c_reg_write(self.i2c, address, reg, val)
+
+    def read_multi(self, address:int, reg_first:int, reg_last:int) -> List[int]:
+        return i2c_reg_read_multi(self.i2c, address, reg_first, reg_last)
+
+    def write_bursts(self, address:int, bursts:List[Tuple[int, List[int]]]):
+        i2c_reg_write_bursts(self.i2c, address, bursts)
+
+    def close(self):
+        self.i2c.close()
+
+# linux/i2c-dev.h, linux/i2c.h
+I2C_RDWR = 0x0707
+I2C_RDWR_MAX_MSGS = 42
+I2C_M_RD = 0x0001
+
+# longest register run written in one message, as custom/src/i2cprog.c
+WRITE_MAX_BURST = 100
+
+RDWR_TYPES = None
+
+def rdwr_types():
+    # ctypes with the i2c_msg and i2c_rdwr_ioctl_data structures, built when rdwr is first used
+    global RDWR_TYPES
+    if RDWR_TYPES is None:
+        import ctypes
+
+        class i2c_msg(ctypes.Structure):
+            _fields_ = [
+                ("addr", ctypes.c_uint16),
+                ("flags", ctypes.c_uint16),
+                ("len", ctypes.c_uint16),
+                ("buf", ctypes.POINTER(ctypes.c_uint8)),
+            ]
+
+        class i2c_rdwr_ioctl_data(ctypes.Structure):
+            _fields_ = [
+                ("msgs", ctypes.POINTER(i2c_msg)),
+                ("nmsgs", ctypes.c_uint32),
+            ]
+
+        RDWR_TYPES = (ctypes, i2c_msg, i2c_rdwr_ioctl_data)
+    return RDWR_TYPES
+
+class RdwrTransport:
+    # I2C_RDWR ioctl issued directly on i2c_msg/i2c_rdwr_ioctl_data structures and
+    # buffers allocated once, so a transfer only patches lengths and addresses
+    MAX_BURST = 128
+
+    def __init__(self, dev:str):
+        ctypes, i2c_msg, i2c_rdwr_ioctl_data = rdwr_types()
+        self.devpath = dev
+        self.fd = os.open(dev, os.O_RDWR)
+        self.write_buf = (ctypes.c_uint8 * (self.MAX_BURST + 1))()
+        self.read_buf = (ctypes.c_uint8 * self.MAX_BURST)()
+        self.msgs = (i2c_msg * 2)()
+        self.msgs[0].buf = self.write_buf
+        self.msgs[1].buf = self.read_buf
+        self.msgs[1].flags = I2C_M_RD
+        self.rdwr = i2c_rdwr_ioctl_data(self.msgs, 0)
+        # write bursts: one fixed slot of the pool per message
+        self.slot = WRITE_MAX_BURST + 1
+        self.burst_pool = (ctypes.c_uint8 * (I2C_RDWR_MAX_MSGS * self.slot))()
+        self.burst_msgs = (i2c_msg * I2C_RDWR_MAX_MSGS)()
+        for i in range(I2C_RDWR_MAX_MSGS):
+            self.burst_msgs[i].buf = ctypes.cast(ctypes.byref(self.burst_pool, i * self.slot), ctypes.POINTER(ctypes.c_uint8))
+        self.burst_rdwr = i2c_rdwr_ioctl_data(self.burst_msgs, 0)
+
+    def transfer(self, address:int, nmsgs:int):
+        msgs = self.msgs
+        msgs[0].addr = address
+        msgs[1].addr = address
+        self.rdwr.nmsgs = nmsgs
+        fcntl.ioctl(self.fd, I2C_RDWR, self.rdwr)
+
+    def read(self, address:int, reg:int) -> int:
+        return self.read_multi(address, reg, reg)[0]
+
+    def write(self, address:int, reg:int, val:int):
+        self.write_buf[0] = reg
+        self.write_buf[1] = val
+        self.msgs[0].len = 2
+        self.transfer(address, 1)
+
+    def read_multi(self, address:int, reg_first:int, reg_last:int) -> List[int]:
+        count = reg_last - reg_first + 1
+        # checked before the ctypes buffers are touched, they hold MAX_BURST bytes
+        if count < 1 or count > self.MAX_BURST:
+            raise ValueError("read of %d registers, at most %d per transfer" % (count, self.MAX_BURST))
+        self.write_buf[0] = reg_first & 0x7F
+        self.msgs[0].len = 1
+        self.msgs[1].len = count
+        self.transfer(address, 2)
+        return self.read_buf[:count]
+
+    def write_bursts(self, address:int, bursts:List[Tuple[int, List[int]]]):
+        msgs = self.burst_msgs
+        pool = self.burst_pool
+        if len(bursts) > I2C_RDWR_MAX_MSGS:
+            raise ValueError("%d write bursts, at most %d per transfer" % (len(bursts), I2C_RDWR_MAX_MSGS))
+        for reg_first, vals in bursts:
+            if len(vals) > WRITE_MAX_BURST:
+                raise ValueError("write burst of %d registers, at most %d" % (len(vals), WRITE_MAX_BURST))
+        for i, (reg_first, vals) in enumerate(bursts):
+            offset = i * self.slot
+            pool[offset] = reg_first
+            pool[offset+1:offset+1+len(vals)] = vals
+            msgs[i].addr = address
+            msgs[i].len = len(vals) + 1
+        self.burst_rdwr.nmsgs = len(bursts)
+        fcntl.ioctl(self.fd, I2C_RDWR, self.burst_rdwr)
+
+    def close(self):
+        os.close(self.fd)
+
+# bus time per byte, 8 data bits and the ack at 100 kHz; SRC4392_EMU_BYTE_US overrides it
+EMULATOR_BYTE_TIME = float(os.environ.get("SRC4392_EMU_BYTE_US", "90")) * 1e-6
+
+class SRC4392Emulator:
+    # register model of one chip: pages 0-2 behind the 0x7F page select, register address
+    # auto-increment, read-only status registers holding seeded received data, software
+    # reset, and the RBTI/TBTI block transfer status raised once per block at fs
+    def __init__(self, seed:str, fs:int=48000):
+        import random
+        rnd = random.Random(seed)
+        self.readonly = {}
+        self.pages = {}
+        for page in SCHEMA_PAGES:
+            first, last = PAGE_SPAN[page]
+            self.readonly[page] = set(reg for reg in range(0x7F) if not first <= reg <= last or reg_volatile(page, reg))
+            self.pages[page] = bytearray(rnd.randrange(256) if reg in self.readonly[page] else 0 for reg in range(0x80))
+        self.page = 0
+        self.pointer = 0
+        self.period = BLOCK_FRAMES / fs
+        self.blocks_seen = {}
+
+    def set_status(self, page:int, reg:int, val:int):
+        # received data the chip would report, read-only from the bus
+        self.pages[page][reg] = val
+
+    def reset(self):
+        for page in SCHEMA_PAGES:
+            for reg in range(0x7F):
+                if reg not in self.readonly[page]:
+                    self.pages[page][reg] = 0
+        self.page = 0
+
+    def read_byte(self) -> int:
+        reg = self.pointer
+        self.pointer = (reg + 1) & 0x7F
+        if reg == 0x7F:
+            return self.page
+        val = self.pages[self.page][reg]
+        if self.page == 0:
+            for status_reg, status_bit in BLOCK_STATUS.values():
+                if reg == status_reg:
+                    # set on the first read after each block boundary, as the rising edge mode latches it
+                    block = int(time.monotonic() / self.period)
+                    if self.blocks_seen.get(reg) != block:
+                        self.blocks_seen[reg] = block
+                        val |= status_bit
+                    else:
+                        val &= ~status_bit
+        return val
+
+    def write_byte(self, val:int):
+        reg = self.pointer
+        self.pointer = (reg + 1) & 0x7F
+        if reg == 0x7F:
+            if val in self.pages:
+                self.page = val
+        elif self.page == 0 and reg == 0x01 and val & 0x80:
+            self.reset()
+        elif reg not in self.readonly[self.page]:
+            self.pages[self.page][reg] = val
+
+class EmulatedI2C:
+    # periphery.I2C stand-in: an emulated SRC4392 at every address the channel registry
+    # lists on the bus (0x70 otherwise), with the transfer time of every byte slept
+    class Message:
+        # as periphery.I2C.Message
+        def __init__(self, data, read:bool=False, flags:int=0):
+            self.data = data
+            self.read = read
+            self.flags = flags
+
+    def __init__(self, dev:str, byte_time:float=None):
+        self.devpath = dev
+        self.byte_time = EMULATOR_BYTE_TIME if byte_time is None else byte_time
+        addresses = [ int(info.get("address", "0x70"), 16) for info in channel_registry()["channels"].values() if info["dev"] == dev ]
+        self.chips = { address: SRC4392Emulator("%s@%d" % (dev, address)) for address in (addresses or [ 0x70 ]) }
+        self.transfers = 0
+        self.bytes = 0
+        self.bus_time = 0.0
+
+    def transfer(self, address:int, messages:List):
+        chip = self.chips.get(address)
+        if chip is None:
+            raise IOError(errno.EREMOTEIO, "no device at 0x%02x on %s" % (address, self.devpath))
+        nbytes = 0
+        for msg in messages:
+            # the address byte and the data
+            nbytes += 1 + len(msg.data)
+            if msg.read:
+                data = [ chip.read_byte() for i in range(len(msg.data)) ]
+                if isinstance(msg.data, bytearray):
+                    msg.data[:] = data
+                elif isinstance(msg.data, bytes):
+                    msg.data = bytes(data)
+                else:
+                    msg.data = data
+            else:
+                chip.pointer = msg.data[0] & 0x7F
+                for val in msg.data[1:]:
+                    chip.write_byte(val)
+        delay = nbytes * self.byte_time
+        self.transfers += 1
+        self.bytes += nbytes
+        self.bus_time += delay
+        if delay > 0:
+            time.sleep(delay)
+
+    def close(self):
+        pass
+
+# emulated buses by device, so every transport opened in the process sees the same chips
+EMULATED_BUSES:Dict[str, EmulatedI2C] = {}
+
+class EmulatorTransport(PeripheryTransport):
+    # the periphery transport on an emulated bus, for running without the hardware
+    def __init__(self, dev:str):
+        self.devpath = dev
+        if dev not in EMULATED_BUSES:
+            EMULATED_BUSES[dev] = EmulatedI2C(dev)
+        self.i2c = EMULATED_BUSES[dev]
+
+# binary trace: a header, then per transfer a record of monotonic time, kind, bus id,
+# address, page (0xFF unknown), register, length and the bytes; bus ids are defined by
+# TRACE_BUS records holding the device name
+TRACE_MAGIC = b"S4392TR\x01"
+TRACE_RECORD = struct.Struct("<dBBBBBH")
+TRACE_READ = 0
+TRACE_WRITE = 1
+TRACE_BUS = 2
+
+class TraceLog:
+    # append-only, shared by the transports of every bus tracing to the same file
+    def __init__(self, path:str):
+        self.lock = threading.Lock()
+        self.f = open(path, "ab")
+        if self.f.tell() == 0:
+            self.f.write(TRACE_MAGIC)
+        self.buses = {}
+
+    def append(self, kind:int, bus:str, address:int, page:int, reg:int, data:List[int]):
+        t = time.monotonic()
+        with self.lock:
+            if bus not in self.buses:
+                self.buses[bus] = len(self.buses)
+                name = bus.encode()
+                self.f.write(TRACE_RECORD.pack(t, TRACE_BUS, self.buses[bus], 0, 0, 0, len(name)) + name)
+            self.f.write(TRACE_RECORD.pack(t, kind, self.buses[bus], address, page, reg, len(data)) + bytes(data))
+
+    def flush(self):
+        with self.lock:
+            self.f.flush()
+
+TRACE_PATH = os.environ.get("SRC4392_TRACE")
+TRACE_LOGS:Dict[str, TraceLog] = {}
+# the buses are opened from one thread each, the file has to be opened once
+TRACE_LOCK = threading.Lock()
+
+def trace_records(path:str) -> Iterator[Tuple[float, int, str, int, int, int, bytes]]:
+    # (time, kind, bus, address, page, register, bytes) of every transfer in a trace
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:len(TRACE_MAGIC)] != TRACE_MAGIC:
+        raise ValueError("not an SRC4392 trace: " + path)
+    buses = {}
+    offset = len(TRACE_MAGIC)
+    while offset + TRACE_RECORD.size <= len(raw):
+        t, kind, bus, address, page, reg, length = TRACE_RECORD.unpack_from(raw, offset)
+        offset += TRACE_RECORD.size
+        data = raw[offset:offset+length]
+        offset += length
+        if kind == TRACE_BUS:
+            # a later session appending to the file numbers its buses again
+            buses[bus] = data.decode()
+        else:
+            yield t, kind, buses[bus], address, page, reg, data
+
+class TraceTransport:
+    # records every transfer of the wrapped transport, with the page each register is on
+    def __init__(self, transport, path:str):
+        self.transport = transport
+        self.devpath = transport.devpath
+        with TRACE_LOCK:
+            if path not in TRACE_LOGS:
+                TRACE_LOGS[path] = TraceLog(path)
+        self.log = TRACE_LOGS[path]
+        self.pages = {}
+
+    def record(self, kind:int, address:int, reg:int, vals:List[int]):
+        self.log.append(kind, self.devpath, address, self.pages.get(address, 0xFF), reg, vals)
+        if kind == TRACE_WRITE:
+            if reg <= 0x7F < reg + len(vals):
+                self.pages[address] = vals[0x7F - reg]
+            elif reg <= 0x01 < reg + len(vals) and self.pages.get(address) == 0 and vals[0x01 - reg] & 0x80:
+                self.pages[address] = 0
+
+    def read(self, address:int, reg:int) -> int:
+        val = self.transport.read(address, reg)
+        self.record(TRACE_READ, address, reg, [ val ])
+        return val
+
+    def write(self, address:int, reg:int, val:int):
+        self.transport.write(address, reg, val)
+        self.record(TRACE_WRITE, address, reg, [ val ])
+
+    def read_multi(self, address:int, reg_first:int, reg_last:int) -> List[int]:
+        vals = self.transport.read_multi(address, reg_first, reg_last)
+        self.record(TRACE_READ, address, reg_first, vals)
+        return vals
+
+    def write_bursts(self, address:int, bursts:List[Tuple[int, List[int]]]):
+        self.transport.write_bursts(address, bursts)
+        for reg_first, vals in bursts:
+            self.record(TRACE_WRITE, address, reg_first, vals)
+
+    def close(self):
+        self.log.flush()
+        self.transport.close()
+
+class TraceReplay:
+    # a trace split per bus and address; a read gets the next recorded read of the same
+    # registers, or when there is none the registers as last recorded or written; at full
+    # speed, or paced to the recorded time
+    def __init__(self, path:str, realtime:bool=False):
+        self.streams = {}
+        self.t0 = None
+        for t, kind, bus, address, page, reg, data in trace_records(path):
+            if self.t0 is None:
+                self.t0 = t
+            self.streams.setdefault((bus, address), []).append((t, kind, page, reg, data))
+        self.realtime = realtime
+        self.start = None
+        self.cursors = {}
+        self.images = {}
+        self.pages = {}
+
+    def wait(self, t:float):
+        if not self.realtime:
+            return
+        if self.start is None:
+            self.start = time.monotonic() - (t - self.t0)
+        delay = self.start + (t - self.t0) - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def read(self, bus:str, address:int, reg:int, count:int) -> List[int]:
+        key = (bus, address)
+        if key not in self.streams:
+            # nothing recorded from this chip, answer as a bus without it
+            raise IOError(errno.EREMOTEIO, "no device at 0x%02x on %s in the trace" % (address, bus))
+        records = self.streams[key]
+        image = self.images.setdefault(key, {})
+        page = self.pages.get(key, 0)
+        cursor = self.cursors.get(key, 0)
+        # the next recorded read of the same registers, skipping what this reader does not ask for
+        i = cursor
+        while i < len(records) and not (records[i][1] == TRACE_READ and records[i][2] in (page, 0xFF)
+                                        and records[i][3] == reg and len(records[i][4]) == count):
+            i += 1
+        if i < len(records):
+            for t, kind, rec_page, rec_reg, data in records[cursor:i+1]:
+                for n, val in enumerate(data):
+                    image[(rec_page, rec_reg + n)] = val
+            self.cursors[key] = i + 1
+            self.wait(records[i][0])
+            return list(records[i][4])
+        if reg == 0x7F:
+            return [ page ]
+        return [ image.get((page, r), 0) for r in range(reg, reg + count) ]
+
+    def write(self, bus:str, address:int, reg:int, vals:List[int]):
+        key = (bus, address)
+        image = self.images.setdefault(key, {})
+        for n, val in enumerate(vals):
+            if reg + n == 0x7F:
+                self.pages[key] = val
+            else:
+                image[(self.pages.get(key, 0), reg + n)] = val
+
+REPLAY_PATH = os.environ.get("SRC4392_REPLAY")
+REPLAY_REALTIME = False
+REPLAYS:Dict[str, TraceReplay] = {}
+
+class ReplayTransport:
+    # answers from the trace at REPLAY_PATH instead of a bus
+    def __init__(self, dev:str):
+        if REPLAY_PATH is None:
+            raise IOError(errno.ENOENT, "no trace to replay, set SRC4392_REPLAY or --replay")
+        with TRACE_LOCK:
+            if REPLAY_PATH not in REPLAYS:
+                REPLAYS[REPLAY_PATH] = TraceReplay(REPLAY_PATH, REPLAY_REALTIME)
+        self.replay = REPLAYS[REPLAY_PATH]
+        self.devpath = dev
+
+    def read(self, address:int, reg:int) -> int:
+        return self.read_multi(address, reg, reg)[0]
+
+    def write(self, address:int, reg:int, val:int):
+        self.replay.write(self.devpath, address, reg, [ val ])
+
+    def read_multi(self, address:int, reg_first:int, reg_last:int) -> List[int]:
+        return self.replay.read(self.devpath, address, reg_first, reg_last - reg_first + 1)
+
+    def write_bursts(self, address:int, bursts:List[Tuple[int, List[int]]]):
+        for reg_first, vals in bursts:
+            self.replay.write(self.devpath, address, reg_first, vals)
+
+    def close(self):
+        pass
+
+TRANSPORTS = {
+    "periphery": PeripheryTransport,
+    "rdwr": RdwrTransport,
+    "emulator": EmulatorTransport,
+    "replay": ReplayTransport,
+}
+TRANSPORT_DEFAULT = "periphery"
+
+class Histogram:
+    # latencies counted in power of two microsecond buckets
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = {}
+
+    def add(self, seconds:float):
+        us = seconds * 1e6
+        self.count += 1
+        self.total += us
+        if us > self.max:
+            self.max = us
+        bucket = 1 << int(us).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "total_us": round(self.total, 1),
+            "mean_us": round(self.total / self.count, 1) if self.count > 0 else 0,
+            "max_us": round(self.max, 1),
+            "buckets": { "<" + str(bucket) + "us": self.buckets[bucket] for bucket in sorted(self.buckets) }
+        }
+
+class BusStats:
+    # counters of one bus, only updated from the thread scanning it
+    __slots__ = ("transfers", "bytes_read", "bytes_written", "page_switches", "page_switches_saved", "errors", "latency")
+
+    def __init__(self):
+        self.transfers = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.page_switches = 0
+        # counted by SRC4392 against the order the pages were requested in
+        self.page_switches_saved = 0
+        self.errors = 0
+        self.latency = { "read": Histogram(), "write": Histogram() }
+
+    def to_dict(self) -> Dict:
+        return {
+            "transfers": self.transfers,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "page_switches": self.page_switches,
+            "page_switches_saved": self.page_switches_saved,
+            "errors": self.errors,
+            "latency": self.latency
+        }
+
+class Stats:
+    # transfer counters per bus and timings per phase (read, decode, serialize, ...)
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buses:Dict[str, BusStats] = {}
+        self.phases:Dict[str, Histogram] = {}
+
+    def bus(self, dev:str) -> BusStats:
+        with self.lock:
+            if dev not in self.buses:
+                self.buses[dev] = BusStats()
+            return self.buses[dev]
+
+    def add_phase(self, name:str, seconds:float):
+        # phases nest, serialize includes the decoding of lazy views it triggers
+        with self.lock:
+            if name not in self.phases:
+                self.phases[name] = Histogram()
+            self.phases[name].add(seconds)
+
+    def totals(self) -> Dict:
+        keys = [ "transfers", "bytes_read", "bytes_written", "page_switches", "page_switches_saved", "errors" ]
+        totals = { key: 0 for key in keys }
+        totals["bus_us"] = 0.0
+        for bus in self.buses.values():
+            for key in keys:
+                totals[key] += getattr(bus, key)
+            totals["bus_us"] += bus.latency["read"].total + bus.latency["write"].total
+        totals["bus_us"] = round(totals["bus_us"], 1)
+        return totals
+
+    def to_dict(self) -> Dict:
+        return {
+            "totals": self.totals(),
+            "buses": { dev: self.buses[dev] for dev in sorted(self.buses) },
+            "phases": self.phases
+        }
+
+# None while disabled: transports are then not wrapped and profile() returns a shared no-op
+STATS:Stats = Stats() if os.environ.get("SRC4392_STATS") else None
+
+def stats_enable() -> Stats:
+    global STATS
+    if STATS is None:
+        STATS = Stats()
+    return STATS
+
+class StatsTransport:
+    # counts and times every transfer of the wrapped transport
+    def __init__(self, transport, stats:Stats):
+        self.transport = transport
+        self.devpath = transport.devpath
+        self.bus = stats.bus(transport.devpath)
+
+    def timed(self, kind:str, call, *args):
+        t0 = time.perf_counter()
+        try:
+            result = call(*args)
+        except IOError:
+            self.bus.errors += 1
+            raise
+        self.bus.latency[kind].add(time.perf_counter() - t0)
+        self.bus.transfers += 1
+        return result
+
+    def read(self, address:int, reg:int) -> int:
+        val = self.timed("read", self.transport.read, address, reg)
+        self.bus.bytes_written += 1
+        self.bus.bytes_read += 1
+        return val
+
+    def write(self, address:int, reg:int, val:int):
+        self.timed("write", self.transport.write, address, reg, val)
+        self.bus.bytes_written += 2
+        if reg == 0x7F:
+            self.bus.page_switches += 1
+
+    def read_multi(self, address:int, reg_first:int, reg_last:int) -> List[int]:
+        vals = self.timed("read", self.transport.read_multi, address, reg_first, reg_last)
+        self.bus.bytes_written += 1
+        self.bus.bytes_read += len(vals)
+        return vals
+
+    def write_bursts(self, address:int, bursts:List[Tuple[int, List[int]]]):
+        self.timed("write", self.transport.write_bursts, address, bursts)
+        for reg_first, vals in bursts:
+            self.bus.bytes_written += 1 + len(vals)
+            if reg_first <= 0x7F < reg_first + len(vals):
+                self.bus.page_switches += 1
+
+    def close(self):
+        self.transport.close()
+
+class Profile:
+    # times the enclosed block into a phase of the stats
+    __slots__ = ("stats", "name", "t0")
+
+    def __init__(self, stats:Stats, name:str):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats.add_phase(self.name, time.perf_counter() - self.t0)
+        return False
+
+class NoProfile:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NO_PROFILE = NoProfile()
+
+def profile(name:str):
+    # with profile("decode"): ... around any operation, free while the stats are disabled
+    if STATS is None:
+        return NO_PROFILE
+    return Profile(STATS, name)
+
+def open_transport(dev:str, kind:str=TRANSPORT_DEFAULT):
+    # wrapped in a StatsTransport when collecting stats, and a TraceTransport when
+    # tracing to TRACE_PATH; the stats time the bus without the tracing
+    transport = TRANSPORTS[kind](dev)
+    if STATS is not None:
+        transport = StatsTransport(transport, STATS)
+    if TRACE_PATH is not None:
+        transport = TraceTransport(transport, TRACE_PATH)
+    return transport
+
+class FrozenDict(dict):
+    # decoded results are shared between lookups so they must not be modified
+    def readonly(self, *args, **kwargs):
+        raise TypeError("decoded register results are read-only")
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __ior__ = readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+class FieldDecoder:
+    # one field extracted as (val >> shift) & mask; fields whose bits are not in
+    # ascending order (PREEMPHASIS [4,3,2], CATEGORY [7..1]) are then remapped
+    # through a precomputed gather table
+    __slots__ = ("name", "bits", "shift", "mask", "reg_mask", "table", "choices", "choice_index", "desc", "step")
+
+    def __init__(self, name:str, field:Dict):
+        bits = field["bits"]
+        self.name = sys.intern(name)
+        self.bits = tuple(bits)
+        self.shift = min(bits)
+        self.mask = (1 << (max(bits) - self.shift + 1)) - 1
+        self.reg_mask = self.mask << self.shift
+        if list(bits) == list(range(self.shift, max(bits)+1)):
+            self.table = None
+        else:
+            self.table = tuple(self.gather(chunk << self.shift) for chunk in range(self.mask+1))
+        self.choices = intern_choices(field["choices"]) if "choices" in field else None
+        self.choice_index = CHOICE_INDEXES[self.choices] if self.choices is not None else None
+        self.desc = sys.intern(field.get("desc", ""))
+        # everything RegDecoder.decode_value needs, in one tuple
+        self.step = (self.name, self.shift, self.mask, self.table, self.choices)
+
+    def gather(self, val:int) -> int:
+        vfield = 0
+        for i, ibit in enumerate(self.bits):
+            if val & (1<<ibit):
+                vfield += 1<<i
+        return vfield
+
+    def extract(self, val:int) -> int:
+        vfield = (val >> self.shift) & self.mask
+        if self.table is not None:
+            vfield = self.table[vfield]
+        return vfield
+
+    def insert(self, val:int, vfield:int) -> int:
+        # register value with the field replaced, the inverse of extract
+        if self.table is None:
+            return (val & ~self.reg_mask) | vfield << self.shift
+        for i, ibit in enumerate(self.bits):
+            if vfield & 1 << i:
+                val |= 1 << ibit
+            else:
+                val &= ~(1 << ibit)
+        return val
+
+    def encode(self, value) -> int:
+        # field value from an integer or from a string: a choice in any case, an
+        # integer ("3", "0x3"), or else the unique prefix of a choice ("mute")
+        if not isinstance(value, int):
+            value = self.encode_choice(value)
+        if not 0 <= value < 1 << len(self.bits):
+            raise ValueError("%s out of range: %d" % (self.name, value))
+        return value
+
+    def encode_choice(self, text:str) -> int:
+        index = self.choice_index
+        if index is not None and text.lower() in index.values:
+            return index.values[text.lower()]
+        try:
+            return int(text, 0)
+        except ValueError:
+            pass
+        values = index.prefix(text) if index is not None else set()
+        if len(values) == 1:
+            return values.pop()
+        if len(values) > 1:
+            raise ValueError("%s choice %s is ambiguous: %s" % (self.name, text, ", ".join(self.choices[v] for v in sorted(values))))
+        raise ValueError("%s has no choice %s" % (self.name, text))
+
+    def field_regs(self, regs:Tuple[int, ...]) -> List[int]:
+        # register bytes holding the field bits, the first register being the MSB
+        return sorted(set(regs[len(regs) - 1 - ibit // 8] for ibit in self.bits))
+
+class ChoiceIndex:
+    # lower case choice string to field value, shared by every field with the same
+    # choices; the sorted keys find choices by prefix
+    __slots__ = ("choices", "values", "keys")
+
+    def __init__(self, choices:Tuple[str, ...]):
+        self.choices = choices
+        self.values = {}
+        for value, choice in enumerate(choices):
+            self.values.setdefault(choice.lower(), value)
+        self.keys = tuple(sorted(self.values))
+
+    def prefix(self, text:str) -> set:
+        key = text.lower()
+        values = set()
+        for i in range(bisect.bisect_left(self.keys, key), len(self.keys)):
+            if not self.keys[i].startswith(key):
+                break
+            values.add(self.values[self.keys[i]])
+        return values
+
+CHOICE_INDEXES:Dict[Tuple[str, ...], ChoiceIndex] = {}
+
+def intern_choices(choices:List[str]) -> Tuple[str, ...]:
+    choices = tuple(sys.intern(choice) for choice in choices)
+    if choices not in CHOICE_INDEXES:
+        CHOICE_INDEXES[choices] = ChoiceIndex(choices)
+    return CHOICE_INDEXES[choices].choices
+
+# identical field definitions (the channel status bytes of pages 1 and 2 repeat
+# theirs for Ch1 and Ch2) and identical field lists are stored once and shared
+FIELD_INTERN:Dict[Tuple, FieldDecoder] = {}
+FIELD_SETS:Dict[Tuple[FieldDecoder, ...], Tuple] = {}
+
+def intern_field(field:FieldDecoder) -> FieldDecoder:
+    return FIELD_INTERN.setdefault((field.name, field.bits, field.choices, field.desc), field)
+
+def intern_field_set(fields:Tuple[FieldDecoder, ...]) -> Tuple:
+    # (fields, plan, field_map) shared by every register with the same fields
+    fields = tuple(intern_field(field) for field in fields)
+    if fields not in FIELD_SETS:
+        FIELD_SETS[fields] = (fields, tuple(field.step for field in fields), { field.name: field for field in fields })
+    return FIELD_SETS[fields]
+
+class RegDecoder:
+    # register descriptor compiled into a flat list of field extraction plans
+    __slots__ = ("name", "regs", "desc", "volatile", "fields", "plan", "field_map", "lut")
+
+    def __init__(self, reg_info:Dict):
+        self.name = sys.intern(reg_info["name"])
+        self.regs = tuple(reg_info["regs"])
+        self.desc = sys.intern(reg_info["desc"])
+        self.volatile = reg_info.get("volatile")
+        if "fields" in reg_info:
+            # fields in order of their first bit, as the bits are listed in the tables
+            order = {}
+            for key in reg_info["fields"]:
+                order[reg_info["fields"][key]["bits"][0]] = key
+            self.fields = tuple(FieldDecoder(order[ibit], reg_info["fields"][order[ibit]]) for ibit in sorted(order))
+            self.intern()
+        else:
+            self.fields = None
+            self.plan = None
+            self.field_map = {}
+        # single byte registers with fields: decoded result per value, filled on first use;
+        # registers without fields decode to just their value, a table would only cost memory
+        self.lut = {} if len(self.regs) == 1 and self.fields is not None else None
+
+    def intern(self):
+        if self.fields is not None:
+            self.fields, self.plan, self.field_map = intern_field_set(self.fields)
+
+    def decode(self, val:int) -> Dict:
+        lut = self.lut
+        if lut is not None:
+            info = lut.get(val)
+            if info is None:
+                info = lut[val] = self.decode_value(val)
+            return info
+        return self.decode_value(val)
+
+    def decode_value(self, val:int) -> Dict:
+        info = {
+            "desc": self.desc,
+            "value": val
+        }
+        if self.plan is not None:
+            fields = {}
+            sfields = {}
+            for name, shift, mask, table, choices in self.plan:
+                vfield = (val >> shift) & mask
+                if table is not None:
+                    vfield = table[vfield]
+                fields[name] = vfield
+                if choices is not None:
+                    sfields[name] = choices[vfield]
+            info["fields"] = FrozenDict(fields)
+            if len(sfields) > 0:
+                info["sfields"] = FrozenDict(sfields)
+        return FrozenDict(info)
+
+    def build_lut(self):
+        if self.lut is not None:
+            for val in range(256):
+                self.decode(val)
+
+# register span burst read for a whole page
+PAGE_SPAN = {
+    0: (0x01, 0x33),    # Control and Status Registers
+    1: (0x00, 0x6F),    # DIR Channel Status and User Data Buffers
+    2: (0x00, 0x6F),    # DIT Channel Status and User Data Buffers
+}
+PAGE_DECODERS:Dict[int, Tuple[RegDecoder, ...]] = {}
+PAGE_HASH:Dict[int, str] = {}
+
+CACHE_DIR = os.environ.get("SRC4392_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "src4392"))
+CODE_HASH = None
+
+SCHEMA_UNPICKLER = None
+
+def schema_unpickler():
+    # loads the schema classes only, looked up by name whatever module wrote the cache
+    global SCHEMA_UNPICKLER
+    if SCHEMA_UNPICKLER is None:
+        import pickle
+
+        class SchemaUnpickler(pickle.Unpickler):
+            classes = { cls.__name__: cls for cls in (FrozenDict, ChoiceIndex, FieldDecoder, RegDecoder) }
+
+            def find_class(self, module:str, name:str):
+                if name in self.classes:
+                    return self.classes[name]
+                raise pickle.UnpicklingError("unexpected class " + module + "." + name)
+
+        SCHEMA_UNPICKLER = SchemaUnpickler
+    return SCHEMA_UNPICKLER
+
+def schema_path(page:int) -> str:
+    return os.path.join(SCHEMA_DIR, "src4392_page%d.json" % page)
+
+def schema_cache_path(page:int) -> str:
+    # named by the CRC of the table and of this module, so neither an edited table
+    # nor a changed decoder ever loads stale results
+    global CODE_HASH
+    if CODE_HASH is None:
+        with open(os.path.abspath(__file__), "rb") as f:
+            CODE_HASH = "%08x" % zlib.crc32(f.read())
+    return os.path.join(CACHE_DIR, "page%d-%s-%s.pickle" % (page, PAGE_HASH[page], CODE_HASH))
+
+def page_regs(page:int) -> List[Dict]:
+    # raw register table of a page
+    with open(schema_path(page), "rb") as f:
+        return json.loads(f.read())
+
+def schema_save(page:int):
+    # written aside and renamed into place, a failed write leaves nothing behind; entries
+    # of the page for an older table or module are removed once the new one is saved
+    import pickle
+    path = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = schema_cache_path(page)
+        with open(path + ".tmp", "wb") as f:
+            pickle.dump(PAGE_DECODERS[page], f, pickle.HIGHEST_PROTOCOL)
+        os.replace(path + ".tmp", path)
+    except (OSError, pickle.PicklingError):
+        if path is not None:
+            try:
+                os.remove(path + ".tmp")
+            except OSError:
+                pass
+        return
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name.startswith("page%d-" % page) and name.endswith(".pickle") and os.path.join(CACHE_DIR, name) != path:
+            try:
+                os.remove(os.path.join(CACHE_DIR, name))
+            except OSError:
+                pass
+
+def schema_load(page:int) -> Tuple[RegDecoder, ...]:
+    # compiled decoders from the cache when it matches the table, else compiled from the table
+    import pickle
+    with open(schema_path(page), "rb") as f:
+        raw = f.read()
+    PAGE_HASH[page] = "%08x" % zlib.crc32(raw)
+    try:
+        with open(schema_cache_path(page), "rb") as f:
+            decoders = schema_unpickler()(f).load()
+        # a pickle shares fields within its page only, share them with the other pages again
+        for decoder in decoders:
+            decoder.intern()
+        return decoders
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+    PAGE_DECODERS[page] = tuple(RegDecoder(reg_info) for reg_info in json.loads(raw))
+    schema_save(page)
+    return PAGE_DECODERS[page]
+
+def page_decoders(page:int) -> Tuple[RegDecoder, ...]:
+    # compiled once per page, in the same order as the page table
+    if page not in PAGE_DECODERS:
+        PAGE_DECODERS[page] = schema_load(page)
+    return PAGE_DECODERS[page]
+
+def precompute_luts():
+    # complete lookup tables for every single byte register, saved with the compiled pages
+    for page in SCHEMA_PAGES:
+        decoders = page_decoders(page)
+        if any(decoder.lut is not None and len(decoder.lut) < 256 for decoder in decoders):
+            for decoder in decoders:
+                decoder.build_lut()
+            schema_save(page)
+
+def reg_decode(reg_info:Dict, val:int) -> Dict:
+    return RegDecoder(reg_info).decode(val)
+
+class PageSnapshot:
+    # raw image of one register page, decoded without further bus access
+    def __init__(self, page:int, data:bytes=None, timestamp:float=None):
+        self.page = page
+        self.reg_first, self.reg_last = PAGE_SPAN[page]
+        # 0xFF for every byte the image holds, partial reads and saved profiles hold some only
+        if data is None:
+            data = bytes(self.reg_last - self.reg_first + 1)
+            self.valid = bytearray(len(data))
+        else:
+            self.valid = bytearray(b"\xff" * len(data))
+        self.data = bytearray(data)
+        self.timestamp = timestamp
+
+    @classmethod
+    def read(cls, dev:"SRC4392", page:int, bursts:List[Tuple[int, int]]=None) -> "PageSnapshot":
+        # the whole page, or only the given (reg_first, reg_last) bursts
+        snap = cls(page)
+        if bursts is None:
+            snap.data[:] = dev.read_multi(page, snap.reg_first, snap.reg_last)
+            snap.valid[:] = b"\xff" * len(snap.valid)
+        else:
+            for reg_first, reg_last in bursts:
+                snap.data[reg_first-snap.reg_first:reg_last-snap.reg_first+1] = dev.read_multi(page, reg_first, reg_last)
+                snap.valid[reg_first-snap.reg_first:reg_last-snap.reg_first+1] = b"\xff" * (reg_last - reg_first + 1)
+        snap.timestamp = time.time()
+        return snap
+
+    @classmethod
+    def from_regs(cls, page:int, regs:Dict[str, int], timestamp:float=None) -> "PageSnapshot":
+        # saved as { "0x03": 96, ... }, any subset of the page
+        snap = cls(page, timestamp=timestamp)
+        for reg, val in regs.items():
+            if not snap.reg_first <= int(reg, 16) <= snap.reg_last:
+                raise ValueError("page %d register %s outside 0x%02X-0x%02X" % (page, reg, snap.reg_first, snap.reg_last))
+            offset = int(reg, 16) - snap.reg_first
+            snap.data[offset] = val
+            snap.valid[offset] = 0xFF
+        return snap
+
+    def to_regs(self) -> Dict[str, int]:
+        return { "0x%02X" % (self.reg_first + offset): val for offset, val in enumerate(self.data) if self.valid[offset] }
+
+    def reg(self, reg:int) -> int:
+        if reg == 0x7F:
+            return self.page
+        return self.data[reg - self.reg_first]
+
+    def reg_value(self, regs:Tuple[int, ...]) -> int:
+        if len(regs) == 1:
+            return self.reg(regs[0])
+        val = 0
+        for reg in regs:
+            val = val * 256 + self.reg(reg)
+        return val
+
+    def decode(self, decoder:RegDecoder) -> Dict:
+        return decoder.decode(self.reg_value(decoder.regs))
+
+    def decode_list(self, reglist:List[int]) -> Dict:
+        decoders = page_decoders(self.page)
+        return { decoders[i].name: self.decode(decoders[i]) for i in reglist }
+
+    def view(self, reglist:List[int]=None) -> "PageView":
+        return PageView(self, reglist)
+
+class RegView:
+    # one register of a snapshot; field values are extracted from the snapshot
+    # buffer when read, choices and the decoded dict only when asked for
+    __slots__ = ("snap", "decoder")
+
+    def __init__(self, snap:PageSnapshot, decoder:RegDecoder):
+        self.snap = snap
+        self.decoder = decoder
+
+    @property
+    def name(self) -> str:
+        return self.decoder.name
+
+    @property
+    def desc(self) -> str:
+        return self.decoder.desc
+
+    @property
+    def value(self) -> int:
+        return self.snap.reg_value(self.decoder.regs)
+
+    def __getitem__(self, name:str) -> int:
+        return self.decoder.field_map[name].extract(self.value)
+
+    def __getattr__(self, name:str) -> int:
+        if name.startswith("_") or name not in self.decoder.field_map:
+            raise AttributeError(name)
+        return self[name]
+
+    def choice(self, name:str) -> str:
+        field = self.decoder.field_map[name]
+        if field.choices is None:
+            return None
+        return field.choices[field.extract(self.value)]
+
+    def to_dict(self) -> Dict:
+        return self.decoder.decode(self.value)
+
+class PageView:
+    # registers of a snapshot by name (view["0x14"]) or address (view.reg(0x14)),
+    # and fields unique to the page as attributes (view.UNLOCK)
+    __slots__ = ("snap", "reglist")
+
+    def __init__(self, snap:PageSnapshot, reglist:List[int]=None):
+        self.snap = snap
+        self.reglist = reglist if reglist is not None else range(len(page_decoders(snap.page)))
+
+    def __getitem__(self, name:str) -> RegView:
+        return RegView(self.snap, page_decoders(self.snap.page)[page_index(self.snap.page)[name]])
+
+    def reg(self, reg:int) -> RegView:
+        for decoder in page_decoders(self.snap.page):
+            if reg in decoder.regs:
+                return RegView(self.snap, decoder)
+        raise KeyError(reg)
+
+    def __getattr__(self, name:str) -> int:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        matches = [ (i, field) for i, field in field_index(self.snap.page).get(name.upper(), []) if field.name == name ]
+        if len(matches) != 1:
+            raise AttributeError(name)
+        i, field = matches[0]
+        return field.extract(self.snap.reg_value(page_decoders(self.snap.page)[i].regs))
+
+    def __iter__(self):
+        decoders = page_decoders(self.snap.page)
+        for i in self.reglist:
+            yield RegView(self.snap, decoders[i])
+
+    def to_dict(self) -> Dict:
+        with profile("decode"):
+            return self.snap.decode_list(self.reglist)
+
+class FieldChange:
+    # one changed field, or register without fields, between two snapshots;
+    # choice strings are looked up only when serialized
+    __slots__ = ("page", "decoder", "field", "old", "new")
+
+    def __init__(self, page:int, decoder:RegDecoder, field:FieldDecoder, old:int, new:int):
+        self.page = page
+        self.decoder = decoder
+        self.field = field
+        self.old = old
+        self.new = new
+
+    def to_dict(self) -> Dict:
+        info = { "reg": self.decoder.name }
+        if self.field is not None:
+            info["field"] = self.field.name
+        info["old"] = self.old
+        info["new"] = self.new
+        if self.field is not None and self.field.choices is not None:
+            info["old_choice"] = self.field.choices[self.old]
+            info["new_choice"] = self.field.choices[self.new]
+        return info
+
+PAGE_BITS:Dict[int, Dict[int, Tuple]] = {}
+
+def page_bits(page:int) -> Dict[int, Tuple]:
+    # register to the (table index, field, bits of this register byte) it holds
+    if page not in PAGE_BITS:
+        bits = {}
+        for i, decoder in enumerate(page_decoders(page)):
+            if decoder.fields is None:
+                for reg in decoder.regs:
+                    bits.setdefault(reg, []).append((i, None, 0xFF))
+                continue
+            for field in decoder.fields:
+                for ibit in field.bits:
+                    reg = decoder.regs[len(decoder.regs) - 1 - ibit // 8]
+                    masks = bits.setdefault(reg, [])
+                    for n, (j, other, mask) in enumerate(masks):
+                        if j == i and other is field:
+                            masks[n] = (i, field, mask | 1 << ibit % 8)
+                            break
+                    else:
+                        masks.append((i, field, 1 << ibit % 8))
+        PAGE_BITS[page] = { reg: tuple(masks) for reg, masks in bits.items() }
+    return PAGE_BITS[page]
+
+def snapshot_diff(old:PageSnapshot, new:PageSnapshot) -> List[FieldChange]:
+    # XOR of the two images over the bytes both hold, only the changed bits are mapped to fields
+    n = len(old.data)
+    xor = (int.from_bytes(old.data, "big") ^ int.from_bytes(new.data, "big")) \
+        & int.from_bytes(old.valid, "big") & int.from_bytes(new.valid, "big")
+    if xor == 0:
+        return []
+    bits = page_bits(old.page)
+    decoders = page_decoders(old.page)
+    changes = []
+    seen = set()
+    while xor:
+        # highest set bit first, so registers come out in address order
+        shift = (xor.bit_length() - 1) & ~7
+        byte = xor >> shift
+        xor ^= byte << shift
+        for i, field, mask in bits.get(old.reg_first + n - 1 - shift // 8, ()):
+            if byte & mask and (i, field) not in seen:
+                seen.add((i, field))
+                decoder = decoders[i]
+                vold = old.reg_value(decoder.regs)
+                vnew = new.reg_value(decoder.regs)
+                if field is not None:
+                    vold = field.extract(vold)
+                    vnew = field.extract(vnew)
+                changes.append(FieldChange(old.page, decoder, field, vold, vnew))
+    return changes
+
+PAGE_REG_INDEX:Dict[int, Dict[int, Tuple[int, ...]]] = {}
+
+def page_reg_index(page:int) -> Dict[int, Tuple[int, ...]]:
+    # register to the table indices of every descriptor it is part of
+    if page not in PAGE_REG_INDEX:
+        PAGE_REG_INDEX[page] = { reg: tuple(sorted(set(i for i, field, mask in masks))) for reg, masks in page_bits(page).items() }
+    return PAGE_REG_INDEX[page]
+
+class DecodeCache:
+    # previous image and decoded descriptors of one page of a chip; a new snapshot
+    # re-decodes only the descriptors with a byte that changed or was not held before
+    def __init__(self, page:int):
+        self.page = page
+        self.snap = PageSnapshot(page)
+        self.decoded = [ None ] * len(page_decoders(page))
+        for i, decoder in enumerate(page_decoders(page)):
+            if decoder.regs == (0x7F,):
+                self.decoded[i] = decoder.decode(page)
+
+    def update(self, snap:PageSnapshot) -> List[int]:
+        n = len(snap.data)
+        valid = int.from_bytes(snap.valid, "big")
+        xor = ((int.from_bytes(self.snap.data, "big") ^ int.from_bytes(snap.data, "big")) & valid) \
+            | (int.from_bytes(self.snap.valid, "big") ^ valid)
+        index = page_reg_index(self.page)
+        changed = set()
+        while xor:
+            shift = (xor.bit_length() - 1) & ~7
+            xor &= (1 << shift) - 1
+            changed.update(index.get(snap.reg_first + n - 1 - shift // 8, ()))
+        decoders = page_decoders(self.page)
+        for i in changed:
+            self.decoded[i] = snap.decode(decoders[i])
+        self.snap = snap
+        return sorted(changed)
+
+def snapshots_diff(olds:Dict[int, PageSnapshot], news:Dict[int, PageSnapshot]) -> Dict[str, List[FieldChange]]:
+    return { "page%d" % page: snapshot_diff(olds[page], news[page]) for page in sorted(olds) if page in news }
+
+def snapshots_save(path:str, snaps:Dict[str, Dict[int, PageSnapshot]]):
+    # { chan: { "page0": { "0x01": 4, ... }, ... } }
+    saved = {}
+    for chan, chan_snaps in snaps.items():
+        saved[chan] = { "page%d" % page: snap.to_regs() for page, snap in sorted(chan_snaps.items()) }
+    with open(path, "w") as f:
+        f.write(json.dumps(saved, indent=4) + "\n")
+
+def snapshots_load(path:str, chan:str=None) -> Dict[int, PageSnapshot]:
+    # the channel's entry of a saved file, or a golden profile holding the pages directly
+    with open(path, "rb") as f:
+        saved = json.loads(f.read())
+    if chan is not None and chan in saved:
+        saved = saved[chan]
+    elif any(not key.startswith("page") for key in saved):
+        # saved channels, but not this one
+        raise KeyError("no saved registers for " + str(chan) + " in " + path)
+    return { int(key[4:]): PageSnapshot.from_regs(int(key[4:]), regs) for key, regs in saved.items() if key.startswith("page") }
+
+class BurstPlan:
+    # read plan of fixed (reg_first, reg_last) bursts per page
+    def __init__(self, bursts:Dict[int, List[Tuple[int, int]]]):
+        self.pages = { page: ((), tuple(bursts[page])) for page in sorted(bursts) }
+
+class SnapshotPlan(BurstPlan):
+    # read plan for just the bytes a set of snapshots holds
+    def __init__(self, snaps:Dict[int, PageSnapshot]):
+        bursts = {}
+        for page, snap in snaps.items():
+            bursts[page] = reg_bursts([ snap.reg_first + offset for offset, valid in enumerate(snap.valid) if valid ])
+        super().__init__(bursts)
+
+# pages whose registers are all status (received channel status and user data)
+PAGE_VOLATILE = {
+    0: False,
+    1: True,
+    2: False,
+}
+PAGE_STATIC_REGS:Dict[int, set] = {}
+
+def reg_volatile(page:int, reg:int) -> bool:
+    # registers missing from the tables are reserved, treat them as status
+    if page not in PAGE_STATIC_REGS:
+        PAGE_STATIC_REGS[page] = set(
+            reg for decoder in page_decoders(page)
+                if not (decoder.volatile if decoder.volatile is not None else PAGE_VOLATILE[page]) for reg in decoder.regs
+        )
+    return reg not in PAGE_STATIC_REGS[page]
+
+class SRC4392:
+    # currently selected page, shadow registers and pending writes per (bus, address),
+    # shared by every object on the same chip
+    selected_page:Dict[Tuple[str, int], int] = {}
+    shadows:Dict[Tuple[str, int], Dict[Tuple[int, int], int]] = {}
+    dirties:Dict[Tuple[str, int], set] = {}
+    decode_caches:Dict[Tuple[str, int], Dict[int, DecodeCache]] = {}
+
+    def __init__(self, transport, address:int=0x70, cache:bool=True, write_through:bool=True):
+        self.transport = transport
+        self.address = address
+        self.key = (transport.devpath, address)
+        self.cache = cache
+        self.write_through = write_through
+        self.shadow = SRC4392.shadows.setdefault(self.key, {})
+        self.dirty = SRC4392.dirties.setdefault(self.key, set())
+        self.decode_cache = SRC4392.decode_caches.setdefault(self.key, {})
+        self.page_switches = 0
+        self.page_switches_saved = 0
+        # pages selected during a reordered read, None outside one
+        self.visited = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.redecodes = 0
+
+    def page(self) -> int:
+        return SRC4392.selected_page.get(self.key)
+
+    def select_page(self, page:int):
+        if self.visited is not None:
+            self.visited.add(page)
+        if SRC4392.selected_page.get(self.key) == page:
+            return
+        self.transport.write(self.address, 0x7F, page)
+        SRC4392.selected_page[self.key] = page
+        self.page_switches += 1
+
+    def cached(self, page:int, reg:int) -> bool:
+        if (page, reg) in self.dirty:
+            return True
+        return self.cache and (page, reg) in self.shadow and not reg_volatile(page, reg)
+
+    def read(self, page:int, reg:int) -> int:
+        if reg == 0x7F and self.page() is not None:
+            return self.page()
+        return self.read_multi(page, reg, reg)[0]
+
+    def read_multi(self, page:int, reg_first:int, reg_last:int) -> List[int]:
+        regs = range(reg_first, reg_last+1)
+        wire = [ reg for reg in regs if not self.cached(page, reg) ]
+        self.cache_hits += len(regs) - len(wire)
+        self.cache_misses += len(wire)
+        if len(wire) > 0:
+            self.select_page(page)
+            if len(wire) == len(regs):
+                bursts = [ (reg_first, reg_last) ]
+            else:
+                bursts = reg_bursts(wire)
+            for first, last in bursts:
+                for reg, val in zip(range(first, last+1), self.transport.read_multi(self.address, first, last)):
+                    if (page, reg) not in self.dirty:
+                        self.shadow[(page, reg)] = val
+        return [ self.shadow[(page, reg)] for reg in regs ]
+
+    def read_uncached(self, page:int, reg_first:int, reg_last:int) -> List[int]:
+        # straight from the chip, for buffers polled faster than the shadow would help
+        self.select_page(page)
+        vals = self.transport.read_multi(self.address, reg_first, reg_last)
+        for reg, val in zip(range(reg_first, reg_last+1), vals):
+            if (page, reg) not in self.dirty:
+                self.shadow[(page, reg)] = val
+        return vals
+
+    def write(self, page:int, reg:int, val:int):
+        if reg == 0x7F:
+            self.select_page(val)
+            return
+        if page == 0 and reg == 0x01 and val & 0x80:
+            # software reset returns the chip to page 0 and its register defaults
+            self.flush()
+            self.select_page(page)
+            self.transport.write(self.address, reg, val)
+            SRC4392.selected_page[self.key] = 0
+            self.invalidate()
+            return
+        self.shadow[(page, reg)] = val
+        if self.write_through:
+            self.select_page(page)
+            self.transport.write(self.address, reg, val)
+        else:
+            self.dirty.add((page, reg))
+
+    def flush(self):
+        # write back pending registers
+        batch = self.write_batch()
+        for page, reg in self.dirty:
+            batch.write(page, reg, self.shadow[(page, reg)])
+        self.dirty.clear()
+        batch.flush()
+
+    def write_batch(self) -> "WriteBatch":
+        return WriteBatch(self)
+
+    def write_bursts(self, bursts:List[Tuple[int, int, List[int]]]):
+        # (page, reg_first, values) bursts sent as one I2C_RDWR transfer with the page
+        # selects inline, split only past I2C_RDWR_MAX_MSGS messages
+        msgs = []
+        page = self.page()
+        for burst_page, reg_first, vals in bursts:
+            if burst_page != page:
+                msgs.append((0x7F, [ burst_page ]))
+                page = burst_page
+                self.page_switches += 1
+            msgs.append((reg_first, vals))
+            if burst_page == 0 and reg_first == 0x01 and vals[0] & 0x80:
+                page = 0
+        for i in range(0, len(msgs), I2C_RDWR_MAX_MSGS):
+            self.transport.write_bursts(self.address, msgs[i:i+I2C_RDWR_MAX_MSGS])
+        SRC4392.selected_page[self.key] = page
+
+        for burst_page, reg_first, vals in bursts:
+            if burst_page == 0 and reg_first == 0x01 and vals[0] & 0x80:
+                # the chip is back at its defaults, not at what the reset burst wrote;
+                # like write, leave those registers to be read again
+                self.invalidate()
+                continue
+            for reg, val in zip(range(reg_first, reg_first+len(vals)), vals):
+                self.shadow[(burst_page, reg)] = val
+                self.dirty.discard((burst_page, reg))
+
+    def invalidate(self, page:int=None, reg:int=None):
+        for page_reg in list(self.shadow.keys()):
+            if (page is None or page_reg[0] == page) and (reg is None or page_reg[1] == reg) and page_reg not in self.dirty:
+                del self.shadow[page_reg]
+
+    def page_order(self, pages:List[int]) -> List[int]:
+        # visit the currently selected page first so its select is elided
+        current = self.page()
+        return sorted(set(pages), key=lambda page: (page != current, page))
+
+    def reordered(self, pages:List[int], read):
+        # read() visiting the pages in page_order; the switches saved are those the request
+        # order would have cost, over the pages that went to the bus, less those issued
+        start = self.page()
+        switches = self.page_switches
+        outer = self.visited
+        self.visited = set()
+        try:
+            result = read()
+        finally:
+            visited = self.visited
+            self.visited = outer
+            if outer is not None:
+                outer.update(visited)
+        naive = 0
+        current = start
+        for page in pages:
+            if page in visited and page != current:
+                naive += 1
+                current = page
+        saved = max(0, naive - (self.page_switches - switches))
+        self.page_switches_saved += saved
+        if STATS is not None:
+            STATS.bus(self.transport.devpath).page_switches_saved += saved
+        return result
+
+    def read_regs(self, regs:List[Tuple[int, int]]) -> Dict[Tuple[int, int], int]:
+        # read a set of (page, reg) grouped so each page is selected once
+        by_page = {}
+        for page, reg in regs:
+            by_page.setdefault(page, []).append(reg)
+
+        def read() -> Dict[Tuple[int, int], int]:
+            vals = {}
+            for page in self.page_order(list(by_page.keys())):
+                for reg_first, reg_last in reg_bursts(by_page[page]):
+                    for reg, val in zip(range(reg_first, reg_last+1), self.read_multi(page, reg_first, reg_last)):
+                        vals[(page, reg)] = val
+            return vals
+
+        return self.reordered([ page for page, reg in regs ], read)
+
+    def snapshot(self, page:int) -> PageSnapshot:
+        return PageSnapshot.read(self, page)
+
+    def snapshots(self, pages:List[int]) -> Dict[int, PageSnapshot]:
+        return self.reordered(pages, lambda: { page: self.snapshot(page) for page in self.page_order(pages) })
+
+    def read_plan(self, plan:"ReadPlan") -> Dict[int, PageSnapshot]:
+        # partial snapshots holding just the registers of the plan
+        pages = list(plan.pages.keys())
+        with profile("read"):
+            return self.reordered(pages, lambda: { page: PageSnapshot.read(self, page, plan.pages[page][1]) for page in self.page_order(pages) })
+
+    def set_fields(self, values:Dict[str, object]) -> List[FieldChange]:
+        # read-modify-write from the shadow registers where known, one write per changed
+        # register byte however many of its fields change, none when nothing changes
+        targets = encode_fields(values)
+        regs = self.read_regs([ (page, reg) for page, i in targets for reg in page_decoders(page)[i].regs ])
+        changes = []
+        writes = []
+        for (page, i), fields in targets.items():
+            decoder = page_decoders(page)[i]
+            old = 0
+            for reg in decoder.regs:
+                old = old * 256 + regs[(page, reg)]
+            new = old
+            for field, vfield in fields:
+                new = field.insert(new, vfield)
+                if field.extract(old) != vfield:
+                    changes.append(FieldChange(page, decoder, field, field.extract(old), vfield))
+            for n, reg in enumerate(reversed(decoder.regs)):
+                if (old ^ new) >> 8*n & 0xFF:
+                    writes.append((page, reg, new >> 8*n & 0xFF))
+        if self.write_through:
+            with self.write_batch() as batch:
+                for page, reg, val in writes:
+                    batch.write(page, reg, val)
+        else:
+            for page, reg, val in writes:
+                self.write(page, reg, val)
+        return changes
+
+    def decode(self, snap:PageSnapshot, reglist:List[int]=None) -> Dict[str, Dict]:
+        # decoded registers, reusing the results of the previous snapshot of the page
+        # for every descriptor whose bytes are unchanged
+        if snap.page not in self.decode_cache:
+            self.decode_cache[snap.page] = DecodeCache(snap.page)
+        cache = self.decode_cache[snap.page]
+        with profile("decode"):
+            self.redecodes += len(cache.update(snap))
+        decoders = page_decoders(snap.page)
+        if reglist is None:
+            reglist = range(len(decoders))
+        return { decoders[i].name: cache.decoded[i] for i in reglist }
+
+    def poll(self, plan:"ReadPlan") -> Dict[int, Dict[str, Dict]]:
+        snaps = self.read_plan(plan)
+        return { page: self.decode(snap, plan.pages[page][0]) for page, snap in snaps.items() }
+    
+class WriteBatch:
+    # register writes collected, then flushed as auto-increment bursts in one transfer
+    def __init__(self, dev:SRC4392):
+        self.dev = dev
+        self.regs:Dict[Tuple[int, int], int] = {}
+
+    def __enter__(self) -> "WriteBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+
+    def write(self, page:int, reg:int, val:int):
+        if reg == 0x7F:
+            raise ValueError("page selection is handled by the batch")
+        self.regs[(page, reg)] = val & 0xFF
+
+    def write_multi(self, page:int, reg_first:int, vals:List[int]):
+        for reg, val in zip(range(reg_first, reg_first+len(vals)), vals):
+            self.write(page, reg, val)
+
+    def bursts(self) -> List[Tuple[int, int, List[int]]]:
+        # sorted by page, current page first, and by register; consecutive registers merged
+        regs = dict(self.regs)
+        bursts = []
+        current = self.dev.page()
+        reset = regs.get((0, 0x01), 0) & 0x80
+        if reset:
+            # software reset goes alone and first, everything else is written after it
+            bursts.append((0, 0x01, [ regs.pop((0, 0x01)) ]))
+            current = 0
+        for page, reg in sorted(regs.keys(), key=lambda page_reg: (page_reg[0] != current, page_reg)):
+            if len(bursts) > 0 and bursts[-1][0] == page and bursts[-1][1] + len(bursts[-1][2]) == reg \
+                    and len(bursts[-1][2]) < WRITE_MAX_BURST and not (reset and len(bursts) == 1):
+                bursts[-1][2].append(regs[(page, reg)])
+            else:
+                bursts.append((page, reg, [ regs[(page, reg)] ]))
+        return bursts
+
+    def flush(self):
+        if len(self.regs) > 0:
+            self.dev.write_bursts(self.bursts())
+        self.regs.clear()
+
+# channels, their bus and address and the register groups each one reads, next to this script
+CHANNELS_PATH = os.path.join(SCHEMA_DIR, "src4392_channels.json")
+REGISTRY = None
+
+def channel_registry() -> Dict:
+    global REGISTRY
+    if REGISTRY is None:
+        with open(CHANNELS_PATH, "rb") as f:
+            REGISTRY = json.loads(f.read())
+        REGISTRY["plans"] = {}
+    return REGISTRY
+
+def channel_names() -> List[str]:
+    return list(channel_registry()["channels"].keys())
+
+def group_names() -> List[str]:
+    return list(channel_registry()["groups"].keys())
+
+PAGE_INDEX:Dict[int, Dict[str, int]] = {}
+
+def page_index(page:int) -> Dict[str, int]:
+    # register name ("0x0F-0x11") to position in the page table
+    if page not in PAGE_INDEX:
+        PAGE_INDEX[page] = { decoder.name: i for i, decoder in enumerate(page_decoders(page)) }
+    return PAGE_INDEX[page]
+
+def group_regs(group:str) -> Tuple[int, List[int]]:
+    # "0x07..0x09" selects every table register starting in that range
+    info = channel_registry()["groups"][group]
+    page = info["page"]
+    decoders = page_decoders(page)
+    indices = []
+    for spec in info["regs"]:
+        if ".." in spec:
+            first, last = [ int(reg, 16) for reg in spec.split("..") ]
+            indices += [ i for i, decoder in enumerate(decoders) if first <= decoder.regs[0] <= last ]
+        else:
+            indices.append(page_index(page)[spec])
+    return page, indices
+
+class ReadPlan:
+    # deduplicated table indices per page in address order, with the bursts that cover them
+    def __init__(self, groups:List[str]):
+        by_page = {}
+        for group in groups:
+            page, indices = group_regs(group)
+            by_page.setdefault(page, set()).update(indices)
+        self.groups = tuple(groups)
+        self.pages = {}
+        for page in sorted(by_page):
+            decoders = page_decoders(page)
+            indices = tuple(sorted(by_page[page], key=lambda i: decoders[i].regs[0]))
+            regs = [ reg for i in indices for reg in decoders[i].regs if reg != 0x7F ]
+            self.pages[page] = (indices, tuple(reg_bursts(regs)))
+
+def read_plan(groups:List[str]) -> ReadPlan:
+    # computed once per distinct group list and shared by every channel using it
+    plans = channel_registry()["plans"]
+    key = tuple(groups)
+    if key not in plans:
+        plans[key] = ReadPlan(groups)
+    return plans[key]
+
+class Channel:
+    def __init__(self, name:str, info:Dict):
+        registry = channel_registry()
+        self.name = name
+        self.dev = info["dev"]
+        self.address = int(info.get("address", "0x70"), 16)
+        self.groups = info.get("groups", registry["profiles"].get(info.get("profile"), []))
+
+    def plan(self, groups:List[str]=None) -> ReadPlan:
+        return read_plan(groups if groups is not None else self.groups)
+
+def channel(chan:str) -> Channel:
+    info = channel_registry()["channels"].get(chan)
+    if info is None:
+        return None
+    return Channel(chan, info)
+
+FIELD_INDEX:Dict[int, Dict[str, List[Tuple[int, FieldDecoder]]]] = {}
+
+def field_index(page:int) -> Dict[str, List[Tuple[int, FieldDecoder]]]:
+    # upper case field name to (table index, field) for every register of a page
+    if page not in FIELD_INDEX:
+        index = {}
+        for i, decoder in enumerate(page_decoders(page)):
+            for field in decoder.fields or ():
+                index.setdefault(field.name.upper(), []).append((i, field))
+        FIELD_INDEX[page] = index
+    return FIELD_INDEX[page]
+
+def qualifier_scope(qualifier:str) -> Dict[int, set]:
+    # pages and table indices a qualifier selects, None for the whole page
+    if qualifier in channel_registry()["groups"]:
+        page, indices = group_regs(qualifier)
+        return { page: set(indices) }
+    if qualifier in [ "page%d" % page for page in SCHEMA_PAGES ]:
+        return { int(qualifier[4:]): None }
+    scope = {}
+    for page in SCHEMA_PAGES:
+        indices = set(i for reg, i in page_index(page).items() if reg.lower() == qualifier)
+        if len(indices) > 0:
+            scope[page] = indices
+    if len(scope) == 0:
+        raise ValueError("unknown field qualifier " + qualifier)
+    return scope
+
+def field_select(selector:str) -> List[Tuple[int, int, FieldDecoder]]:
+    # "FIELD" on any page, or "QUALIFIER.FIELD" where each qualifier is a register
+    # group ("rx"), a register ("0x14") or a page ("page1"), e.g. "page2.0x00.FORMAT";
+    # case-insensitive
+    parts = selector.strip().split(".")
+    name = parts[-1]
+    scope = { page: None for page in SCHEMA_PAGES }
+    for qualifier in parts[:-1]:
+        narrow = qualifier_scope(qualifier.lower())
+        scope = { page: narrow[page] if indices is None else (indices if narrow[page] is None else indices & narrow[page])
+                  for page, indices in scope.items() if page in narrow }
+
+    matches = []
+    for page, indices in scope.items():
+        for i, field in field_index(page).get(name.upper(), []):
+            if indices is None or i in indices:
+                matches.append((page, i, field))
+    if len(matches) == 0:
+        raise ValueError("unknown field " + selector)
+    return matches
+
+def encode_fields(values:Dict[str, object]) -> Dict[Tuple[int, int], List[Tuple[FieldDecoder, int]]]:
+    # { selector: value } to the encoded fields of each (page, table index); every
+    # selector has to name exactly one field, of a register that is not status
+    targets = {}
+    volatile = []
+    for selector, value in values.items():
+        matches = field_select(selector)
+        if len(matches) != 1:
+            raise ValueError("ambiguous field %s, qualify it with one of %s" % (selector,
+                ", ".join("page%d.%s.%s" % (page, page_decoders(page)[i].name, field.name) for page, i, field in matches)))
+        page, i, field = matches[0]
+        decoder = page_decoders(page)[i]
+        if decoder.volatile if decoder.volatile is not None else PAGE_VOLATILE[page]:
+            volatile.append("page%d.%s.%s" % (page, decoder.name, field.name))
+            continue
+        targets.setdefault((page, i), []).append((field, field.encode(value)))
+    if len(volatile) > 0:
+        raise ValueError("read-only status fields: " + ", ".join(volatile))
+    return targets
+
+class FieldQuery:
+    # fields picked by comma separated selectors, with the fewest bursts covering
+    # just the register bytes that hold them; read with SRC4392.read_plan
+    def __init__(self, selectors:str):
+        self.selectors = tuple(sel.strip() for sel in selectors.split(",") if sel.strip() != "")
+        by_page = {}
+        for selector in self.selectors:
+            for page, i, field in field_select(selector):
+                fields = by_page.setdefault(page, {}).setdefault(i, [])
+                if field not in fields:
+                    fields.append(field)
+        self.pages = {}
+        for page in sorted(by_page):
+            decoders = page_decoders(page)
+            indices = sorted(by_page[page], key=lambda i: decoders[i].regs[0])
+            regs = set()
+            for i in indices:
+                for field in by_page[page][i]:
+                    regs.update(reg for reg in field.field_regs(decoders[i].regs) if reg != 0x7F)
+            self.pages[page] = (tuple((i, tuple(by_page[page][i])) for i in indices), tuple(reg_bursts(sorted(regs))))
+
+    def decode(self, snaps:Dict[int, PageSnapshot]) -> Dict[str, Dict]:
+        # only the selected fields; the other bits of their registers were not read
+        with profile("decode"):
+            result = {}
+            for page, (fields, bursts) in self.pages.items():
+                decoders = page_decoders(page)
+                regs = {}
+                for i, reg_fields in fields:
+                    decoder = decoders[i]
+                    val = snaps[page].reg_value(decoder.regs)
+                    info = {
+                        "desc": decoder.desc,
+                        "fields": { field.name: field.extract(val) for field in reg_fields }
+                    }
+                    sfields = { field.name: field.choices[info["fields"][field.name]] for field in reg_fields if field.choices is not None }
+                    if len(sfields) > 0:
+                        info["sfields"] = sfields
+                    regs[decoder.name] = info
+                result["page%d" % page] = regs
+            return result
+
+# IEC 60958 channel status, 24 bytes per subframe interleaved Ch1/Ch2 at 0x00-0x2F of the
+# DIR (page 1) and DIT (page 2) buffers; consumer and professional layouts next to this script
+IEC60958_PATH = os.path.join(SCHEMA_DIR, "src4392_iec60958.json")
+CS_BYTES = 24
+CS_SPAN = (0x00, 0x2F)
+CS_LAYOUTS:Dict[str, "ChannelStatusLayout"] = {}
+# register bit 7 holds channel status bit 0, so multi-byte values are read bit reversed
+BIT_REVERSE = tuple(int("{:08b}".format(val)[::-1], 2) for val in range(256))
+CRC8_TABLE = None
+
+def cs_crc(block:bytes) -> int:
+    # CRCC over bytes 0-22: x^8 + x^4 + x^3 + x^2 + 1 (0x1D) from all ones, bits in
+    # transmission order, which is MSB first in the register bytes
+    global CRC8_TABLE
+    if CRC8_TABLE is None:
+        table = []
+        for crc in range(256):
+            for i in range(8):
+                crc = ((crc << 1) ^ 0x1D) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+            table.append(crc)
+        CRC8_TABLE = tuple(table)
+    crc = 0xFF
+    for byte in block[:CS_BYTES-1]:
+        crc = CRC8_TABLE[crc ^ byte]
+    return crc
+
+class ChannelStatusLayout:
+    # field bits are numbered per byte in channel status order and compiled into
+    # FieldDecoders over the whole block read as one integer; "same_as" takes the
+    # choices of a page 1 field; "bytes" spans are ASCII or LSB first binary
+    def __init__(self, name:str, fields:List[Dict]):
+        self.name = name
+        self.fields = []
+        self.spans = []
+        for info in fields:
+            if "bytes" in info:
+                self.spans.append((info["name"], info["bytes"][0], info["bytes"][1], info.get("ascii", False)))
+                continue
+            field = dict(info)
+            if "same_as" in info:
+                page, i, other = field_select(info["same_as"])[0]
+                field["choices"] = other.choices
+                field.setdefault("desc", other.desc)
+            field["bits"] = [ 8 * (CS_BYTES - 1 - info["byte"]) + 7 - ibit for ibit in info["bits"] ]
+            self.fields.append(intern_field(FieldDecoder(info["name"], field)))
+
+    def decode(self, block:bytes) -> Dict:
+        val = int.from_bytes(block, "big")
+        fields = {}
+        sfields = {}
+        for field in self.fields:
+            vfield = field.extract(val)
+            fields[field.name] = vfield
+            if field.choices is not None:
+                sfields[field.name] = field.choices[vfield]
+        for name, first, last, ascii in self.spans:
+            data = bytes(BIT_REVERSE[byte] for byte in block[first:last+1])
+            fields[name] = data.rstrip(b"\0").decode("ascii", "replace") if ascii else int.from_bytes(data, "little")
+        return {
+            "layout": self.name,
+            "fields": fields,
+            "sfields": sfields
+        }
+
+def cs_layouts() -> Dict[str, ChannelStatusLayout]:
+    if len(CS_LAYOUTS) == 0:
+        with open(IEC60958_PATH, "rb") as f:
+            for name, fields in json.loads(f.read()).items():
+                CS_LAYOUTS[name] = ChannelStatusLayout(name, fields)
+    return CS_LAYOUTS
+
+def cs_decode(block:bytes) -> Dict:
+    # one 24 byte channel status block, professional when its first bit is set
+    professional = block[0] & 0x80
+    info = cs_layouts()["professional" if professional else "consumer"].decode(block)
+    if professional:
+        info["crc_ok"] = cs_crc(block) == block[CS_BYTES-1]
+    return info
+
+def snapshot_channel_status(snap:PageSnapshot) -> Dict[str, Dict]:
+    # even registers hold Ch1, odd registers Ch2
+    block = snap.data[CS_SPAN[0]-snap.reg_first:CS_SPAN[1]-snap.reg_first+1]
+    with profile("decode"):
+        return {
+            "Ch1": cs_decode(bytes(block[0::2])),
+            "Ch2": cs_decode(bytes(block[1::2]))
+        }
+
+# user data buffers of the DIR (page 1) and DIT (page 2), refilled once per 192 frame block
+USER_DATA_SPAN = (0x40, 0x6F)
+BLOCK_FRAMES = 192
+# page 0 status bit set when a block has been transferred to the page buffers: RBTI, TBTI
+BLOCK_STATUS = {
+    1: (0x14, 0x01),
+    2: (0x0A, 0x01),
+}
+
+def user_data_stream(dev:SRC4392, page:int=1, sync:bool=True, fs:int=48000, timeout:float=1.0) -> Iterator[Tuple[bytes, int]]:
+    # the whole 48 byte buffer in one burst per block: once the block transfer status is
+    # seen, or on the block period at fs without sync; with the block periods missed since
+    # the previous block
+    period = BLOCK_FRAMES / fs
+    status_reg, status_bit = BLOCK_STATUS[page]
+    block = time.monotonic()
+    last = None
+    while True:
+        if sync:
+            # the status stays set in level mode, so the next block is not looked for before half a period
+            delay = block + period / 2 - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            started = time.monotonic()
+            while not dev.read_uncached(0, status_reg, status_reg)[0] & status_bit:
+                if time.monotonic() - started > timeout:
+                    raise TimeoutError("no block transfer on page %d" % page)
+                time.sleep(period / 8)
+            block = time.monotonic()
+        else:
+            block += period
+            delay = block - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # fell behind, keep the period from now on
+                block = time.monotonic()
+        missed = 0 if last is None else max(0, round((block - last) / period) - 1)
+        last = block
+        yield bytes(dev.read_uncached(page, USER_DATA_SPAN[0], USER_DATA_SPAN[1])), missed
+
+def chan_user_data(chan:str, page:int=1, blocks:int=None, transport:str=TRANSPORT_DEFAULT, sync:bool=True) -> Iterator[Tuple[bytes, int]]:
+    ch = channel(chan)
+    bus = open_transport(ch.dev, transport)
+    try:
+        src = SRC4392(bus, ch.address)
+        # back on page 0 however the stream ends: all blocks read, a timeout, or closed early
+        try:
+            for n, block in enumerate(user_data_stream(src, page, sync)):
+                yield block
+                if blocks is not None and n + 1 >= blocks:
+                    break
+        finally:
+            src.select_page(0)
+    finally:
+        bus.close()
+
+def chan_snapshots(chan:str, transport:str=TRANSPORT_DEFAULT, plan=None) -> Dict[int, PageSnapshot]:
+    # partial snapshots of a read plan, the channel profile by default
+    ch = channel(chan)
+    bus = open_transport(ch.dev, transport)
+    try:
+        src = SRC4392(bus, ch.address)
+        snaps = src.read_plan(plan if plan is not None else ch.plan())
+        src.select_page(0)
+    finally:
+        bus.close()
+    return snaps
+
+def user_data_channels(chans:List[str], page:int=1, blocks:int=None, transport:str=TRANSPORT_DEFAULT, sync:bool=True,
+                       emit=None) -> Dict[str, Dict]:
+    # one thread per bus as scan_channels, so a slow bus does not hold back the blocks of the
+    # others; the channels of a bus take turns. emit(chan, data, missed) is called for every
+    # block, one call at a time; returns the blocks read and missed per channel
+    by_bus = {}
+    for chan in chans:
+        by_bus.setdefault(channel(chan).dev, []).append(chan)
+    results = { chan: { "blocks": 0, "missed": 0 } for chan in chans }
+    failures = []
+    lock = threading.Lock()
+
+    def run(bus_chans:List[str]):
+        streams = [ (chan, chan_user_data(chan, page, blocks, transport, sync)) for chan in bus_chans ]
+        try:
+            active = list(streams)
+            while len(active) > 0:
+                for chan, stream in list(active):
+                    try:
+                        data, missed = next(stream)
+                    except StopIteration:
+                        active.remove((chan, stream))
+                        continue
+                    except IOError as e:
+                        results[chan]["error"] = str(e)
+                        active.remove((chan, stream))
+                        continue
+                    results[chan]["blocks"] += 1
+                    results[chan]["missed"] += missed
+                    if emit is not None:
+                        with lock:
+                            emit(chan, data, missed)
+        except BaseException as e:
+            failures.append(e)
+        finally:
+            # streams left suspended are closed so their chips go back to page 0
+            for chan, stream in streams:
+                stream.close()
+
+    threads = [ threading.Thread(target=run, args=(bus_chans,)) for bus_chans in list(by_bus.values())[1:] ]
+    for thread in threads:
+        thread.start()
+    run(list(by_bus.values())[0])
+    for thread in threads:
+        thread.join()
+    if len(failures) > 0:
+        raise failures[0]
+    return results
+
+def chan_scan(chan:str, transport:str=TRANSPORT_DEFAULT, groups:List[str]=None, query:FieldQuery=None) -> Dict:
+    if query is not None:
+        return query.decode(chan_snapshots(chan, transport, query))
+    plan = channel(chan).plan(groups)
+    snaps = chan_snapshots(chan, transport, plan)
+    regs = {}
+    for page in SCHEMA_PAGES:
+        regs["page%d" % page] = snaps[page].view(plan.pages[page][0]) if page in snaps else {}
+    return regs
+
+def chan_set(chan:str, values:Dict[str, object], transport:str=TRANSPORT_DEFAULT) -> List[FieldChange]:
+    ch = channel(chan)
+    bus = open_transport(ch.dev, transport)
+    try:
+        src = SRC4392(bus, ch.address)
+        changes = src.set_fields(values)
+        src.select_page(0)
+    finally:
+        bus.close()
+    return changes
+
+def chan_channel_status(chan:str, transport:str=TRANSPORT_DEFAULT, pages:List[int]=[ 1, 2 ]) -> Dict[str, Dict]:
+    # one 48 byte burst per page
+    snaps = chan_snapshots(chan, transport, BurstPlan({ page: [ CS_SPAN ] for page in pages }))
+    return { "page%d" % page: snapshot_channel_status(snaps[page]) for page in pages }
+
+def channel_status(chans:List[str], transport:str=TRANSPORT_DEFAULT, pages:List[int]=[ 1, 2 ]) -> Dict[str, Dict]:
+    return scan_channels(chans, scan=lambda chan: chan_channel_status(chan, transport, pages))
+
+def chan_diff(chan:str, path:str, transport:str=TRANSPORT_DEFAULT) -> Dict[str, List[FieldChange]]:
+    # the chip against a saved snapshot or golden profile, over the registers the file holds
+    try:
+        saved = snapshots_load(path, chan)
+    except (KeyError, ValueError) as e:
+        return { "error": e.args[0] }
+    return snapshots_diff(saved, chan_snapshots(chan, transport, SnapshotPlan(saved)))
+
+def scan_channels(chans:List[str], transport:str=TRANSPORT_DEFAULT, groups:List[str]=None, query:FieldQuery=None,
+                  scan=None) -> Dict[str, Dict]:
+    # one worker per bus; the chips sit on separate adapters so wall time is the slowest bus.
+    # scan(chan) replaces the register dump, e.g. with chan_snapshots or chan_diff
+    if scan is None:
+        scan = lambda chan: chan_scan(chan, transport, groups, query)
+    by_bus = {}
+    for chan in chans:
+        by_bus.setdefault(channel(chan).dev, []).append(chan)
+
+    def scan_bus(bus_chans:List[str]) -> Dict[str, Dict]:
+        result = {}
+        for chan in bus_chans:
+            try:
+                result[chan] = scan(chan)
+            except IOError as e:
+                result[chan] = { "error": str(e) }
+        return result
+
+    # plain threads, concurrent.futures would import logging on every run
+    results = {}
+    failures = []
+
+    def run(bus_chans:List[str]):
+        try:
+            results.update(scan_bus(bus_chans))
+        except BaseException as e:
+            failures.append(e)
+
+    threads = [ threading.Thread(target=run, args=(bus_chans,)) for bus_chans in list(by_bus.values())[1:] ]
+    for thread in threads:
+        thread.start()
+    # the first bus on this thread, a single channel starts no thread at all
+    run(list(by_bus.values())[0])
+    for thread in threads:
+        thread.join()
+    if len(failures) > 0:
+        raise failures[0]
+    return { chan: results[chan] for chan in chans }
+
+# the backends driving the hardware; the emulator and replay are timed by src4392_bench.py
+BENCH_TRANSPORTS = [ "periphery", "rdwr" ]
+
+def transport_bench(chan:str, count:int, kinds:List[str]=BENCH_TRANSPORTS) -> Dict[str, Dict]:
+    # full uncached page 0/1/2 snapshots per transport, wall and CPU time
+    ch = channel(chan)
+    results = {}
+    for kind in kinds:
+        bus = open_transport(ch.dev, kind)
+        try:
+            src = SRC4392(bus, ch.address, cache=False)
+            t0 = time.perf_counter()
+            c0 = time.process_time()
+            for i in range(count):
+                src.snapshots([ 0, 1, 2 ])
+            cpu = time.process_time() - c0
+            wall = time.perf_counter() - t0
+            src.select_page(0)
+        finally:
+            bus.close()
+        results[kind] = {
+            "snapshots": count,
+            "wall_us": round(wall * 1e6 / count, 1),
+            "cpu_us": round(cpu * 1e6 / count, 1),
+        }
+    return results
+
+# daemon polling tiers: the "live" status registers fast, the page 0 registers of the channel
+# profile slowly, and the channel status only after a status or configuration change
+DAEMON_STATUS_GROUPS = [ "live" ]
+DAEMON_INTERVALS = { "status": 0.1, "config": 5.0 }
+DAEMON_REPORT = 60.0
+
+def daemon_ignored(change:FieldChange) -> bool:
+    # RBTI and TBTI latch every block boundary, they are not a state change
+    return change.field is not None and any(change.decoder.regs == (reg,) and change.field.reg_mask & bit
+                                            for reg, bit in BLOCK_STATUS.values())
+
+class TierBudget:
+    # CPU and bus time spent polling one tier, summed over every chip
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.polls = 0
+        self.cpu = 0.0
+        self.bus_us = 0.0
+        self.transfers = 0
+        self.bytes = 0
+
+    def add(self, cpu:float, bus_us:float, transfers:int, nbytes:int):
+        with self.lock:
+            self.polls += 1
+            self.cpu += cpu
+            self.bus_us += bus_us
+            self.transfers += transfers
+            self.bytes += nbytes
+
+    def report(self, elapsed:float) -> Dict:
+        return {
+            "polls": self.polls,
+            "polls_per_s": round(self.polls / elapsed, 2),
+            "cpu_pct": round(self.cpu * 100 / elapsed, 3),
+            "bus_pct": round(self.bus_us / 1e4 / elapsed, 3),
+            "transfers_per_s": round(self.transfers / elapsed, 1),
+            "bytes_per_s": round(self.bytes / elapsed, 1),
+        }
+
+class ChipMonitor:
+    # one chip polled tier by tier over a transport kept open; the first poll of a tier
+    # reports its state, later polls only the fields that changed
+    def __init__(self, chan:str, transport:str, budgets:Dict[str, TierBudget]):
+        ch = channel(chan)
+        self.chan = chan
+        self.transport = transport
+        self.stats = Stats()
+        self.busstats = self.stats.bus(ch.dev)
+        self.bus = None
+        self.dev = None
+        self.budgets = budgets
+        self.plans = {
+            "status": ReadPlan(DAEMON_STATUS_GROUPS),
+            "config": ReadPlan([ group for group in ch.groups if channel_registry()["groups"][group]["page"] == 0 ]),
+        }
+        self.cs_pages = sorted(set(channel_registry()["groups"][group]["page"] for group in ch.groups) - { 0 })
+        self.snaps = {}
+        self.cs = None
+        self.error = None
+
+    def open(self):
+        # on the first poll, so a missing adapter is reported and retried like a failed poll
+        if self.dev is None:
+            ch = channel(self.chan)
+            self.bus = StatsTransport(open_transport(ch.dev, self.transport), self.stats)
+            # every tier reads the bus, the configuration is what other tools change
+            self.dev = SRC4392(self.bus, ch.address, cache=False)
+
+    def close(self):
+        if self.bus is not None:
+            self.bus.close()
+
+    def measured(self, tier:str, read):
+        busstats = self.busstats
+        c0 = time.thread_time()
+        bus0 = busstats.latency["read"].total + busstats.latency["write"].total
+        transfers0 = busstats.transfers
+        bytes0 = busstats.bytes_read + busstats.bytes_written
+        try:
+            return read()
+        finally:
+            self.budgets[tier].add(time.thread_time() - c0,
+                                   busstats.latency["read"].total + busstats.latency["write"].total - bus0,
+                                   busstats.transfers - transfers0,
+                                   busstats.bytes_read + busstats.bytes_written - bytes0)
+
+    def read_plan(self, plan) -> Dict[int, PageSnapshot]:
+        # another process may have switched the page since the last poll
+        SRC4392.selected_page.pop(self.dev.key, None)
+        snaps = self.dev.read_plan(plan)
+        self.dev.select_page(0)
+        return snaps
+
+    def poll(self, tier:str) -> List[Dict]:
+        try:
+            self.open()
+            events = self.poll_tier(tier)
+            self.error = None
+            return events
+        except IOError as e:
+            # reported once, polling goes on
+            if str(e) == self.error:
+                return []
+            self.error = str(e)
+            return [ { "chan": self.chan, "tier": tier, "error": self.error } ]
+
+    def poll_tier(self, tier:str) -> List[Dict]:
+        plan = self.plans[tier]
+        snaps = self.measured(tier, lambda: self.read_plan(plan))
+        events = []
+        if tier not in self.snaps:
+            state = { "page%d" % page: snaps[page].view(plan.pages[page][0]) for page in snaps }
+            events.append({ "time": time.time(), "chan": self.chan, "tier": tier, "state": state })
+        else:
+            changes = []
+            for page, snap in snaps.items():
+                # status fields within the configuration groups belong to the status tier
+                changes += [ change for change in snapshot_diff(self.snaps[tier][page], snap)
+                             if (tier == "status" or not change.decoder.volatile) and not daemon_ignored(change) ]
+            if len(changes) > 0:
+                events.append({ "time": time.time(), "chan": self.chan, "tier": tier, "changes": changes })
+        self.snaps[tier] = snaps
+        if len(events) > 0 and len(self.cs_pages) > 0:
+            events += self.poll_cs()
+        return events
+
+    def poll_cs(self) -> List[Dict]:
+        plan = BurstPlan({ page: [ CS_SPAN ] for page in self.cs_pages })
+
+        def read() -> Dict[str, Dict]:
+            snaps = self.read_plan(plan)
+            return { "page%d" % page: snapshot_channel_status(snaps[page]) for page in self.cs_pages }
+
+        cs = self.measured("cs", read)
+        if cs == self.cs:
+            return []
+        self.cs = cs
+        return [ { "time": time.time(), "chan": self.chan, "tier": "cs", "state": cs } ]
+
+def monitor_bus(monitors:List[ChipMonitor], intervals:Dict[str, float], stop:threading.Event, emit):
+    # the chips of one bus, each tier polled when due; a late poll is not caught up
+    due = { (i, tier): 0.0 for i in range(len(monitors)) for tier in intervals }
+    while not stop.is_set():
+        now = time.monotonic()
+        for (i, tier), t in due.items():
+            if t <= now:
+                for event in monitors[i].poll(tier):
+                    emit(event)
+                due[(i, tier)] = max(t + intervals[tier], now)
+        stop.wait(max(0.0, min(due.values()) - time.monotonic()))
+
+def daemon(chans:List[str], transport:str=TRANSPORT_DEFAULT, intervals:Dict[str, float]=DAEMON_INTERVALS,
+           report:float=DAEMON_REPORT, duration:float=None, emit=None):
+    # polls until SIGTERM, interrupted or after duration seconds; events and the CPU and
+    # bus budget of every tier, each report seconds and at exit, are passed to emit
+    if emit is None:
+        lock = threading.Lock()
+
+        def emit(event:Dict):
+            line = json.dumps(event, default=json_default)
+            with lock:
+                print(line, flush=True)
+
+    stop = threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        import signal
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    budgets = { tier: TierBudget() for tier in [ "status", "config", "cs" ] }
+    by_bus = {}
+    for chan in chans:
+        by_bus.setdefault(channel(chan).dev, []).append(ChipMonitor(chan, transport, budgets))
+    threads = [ threading.Thread(target=monitor_bus, args=(monitors, intervals, stop, emit), daemon=True)
+                for monitors in by_bus.values() ]
+    t0 = time.monotonic()
+    end = t0 + duration if duration is not None else None
+
+    def budget() -> Dict:
+        elapsed = time.monotonic() - t0
+        return { "time": time.time(), "elapsed": round(elapsed, 1),
+                 "budget": { tier: budgets[tier].report(elapsed) for tier in budgets } }
+
+    for thread in threads:
+        thread.start()
+    try:
+        next_report = t0 + report
+        while not stop.is_set():
+            wait = next_report if end is None else min(next_report, end)
+            if stop.wait(max(0.0, wait - time.monotonic())):
+                break
+            if end is not None and time.monotonic() >= end:
+                break
+            emit(budget())
+            next_report += report
+    except KeyboardInterrupt:
+        pass
+    stop.set()
+    for thread in threads:
+        thread.join()
+    for monitors in by_bus.values():
+        for monitor in monitors:
+            monitor.close()
+    emit(budget())
+
+def main():
+    import argparse
+    global TRACE_PATH, REPLAY_PATH, REPLAY_REALTIME
+    parser = argparse.ArgumentParser(description="Dump SRC4392 registers")
+    parser.add_argument("chan", nargs="?", default="O1",
+                        help="channel (" + ", ".join(channel_names()) + "), a comma separated list or ALL")
+    parser.add_argument("--groups",
+                        help="comma separated register groups (" + ", ".join(group_names()) + ") instead of the channel profile")
+    parser.add_argument("--transport", choices=list(TRANSPORTS.keys()), default=TRANSPORT_DEFAULT,
+                        help="I2C backend")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="time N full snapshots with the periphery and rdwr transports instead of dumping")
+    parser.add_argument("--query", metavar="FIELDS",
+                        help="read only these comma separated fields, optionally qualified by register group, register or page (RX.UNLOCK,SRC.SRI,AMUTE)")
+    parser.add_argument("--save", metavar="FILE",
+                        help="save the raw registers of the channels to FILE instead of dumping")
+    parser.add_argument("--diff", metavar="FILE",
+                        help="list the fields that differ from a saved snapshot or golden profile FILE")
+    parser.add_argument("--set", action="append", metavar="FIELD=VALUE",
+                        help="write a field, by choice string or integer, and list the fields changed; repeatable")
+    parser.add_argument("--cs", action="store_true",
+                        help="decode the IEC 60958 channel status of the DIR (page 1) and DIT (page 2)")
+    parser.add_argument("--user-data", type=int, metavar="N",
+                        help="stream N blocks of user data, one hex line per block")
+    parser.add_argument("--user-page", type=int, choices=[ 1, 2 ], default=1,
+                        help="user data of the DIR (1) or the DIT (2)")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="append every transfer to the binary trace FILE")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="answer from the trace FILE instead of the bus")
+    parser.add_argument("--realtime", action="store_true",
+                        help="replay at the recorded timing rather than at full speed")
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep polling, status fast, configuration slowly and channel status after a change; one JSON event per line")
+    parser.add_argument("--status-interval", type=float, default=DAEMON_INTERVALS["status"], metavar="SECONDS",
+                        help="daemon status register poll interval")
+    parser.add_argument("--config-interval", type=float, default=DAEMON_INTERVALS["config"], metavar="SECONDS",
+                        help="daemon configuration register poll interval")
+    parser.add_argument("--report", type=float, default=DAEMON_REPORT, metavar="SECONDS",
+                        help="daemon CPU and bus budget report interval")
+    parser.add_argument("--duration", type=float, metavar="SECONDS",
+                        help="stop the daemon after SECONDS")
+    parser.add_argument("--stats", action="store_true",
+                        help="count transfers and time the bus and decoding, summary on stderr")
+    args = parser.parse_args()
+    if args.stats:
+        stats_enable()
+    if args.trace is not None:
+        TRACE_PATH = args.trace
+    if args.replay is not None:
+        REPLAY_PATH = args.replay
+        args.transport = "replay"
+    REPLAY_REALTIME = args.realtime
+    chan = args.chan.upper()
+
+    if chan == "ALL":
+        chans = channel_names()
+    else:
+        chans = chan.split(",")
+    for chan in chans:
+        if channel(chan) is None:
+            print("Unknown channel")
+            sys.exit()
+    groups = None
+    if args.groups is not None:
+        groups = args.groups.lower().split(",")
+        for group in groups:
+            if group not in group_names():
+                print("Unknown register group")
+                sys.exit()
+    query = None
+    if args.query is not None:
+        try:
+            query = FieldQuery(args.query)
+        except ValueError as e:
+            print(e)
+            sys.exit()
+
+    values = None
+    if args.set is not None:
+        values = {}
+        for assignment in args.set:
+            selector, _, value = assignment.partition("=")
+            values[selector] = value
+        try:
+            encode_fields(values)
+        except ValueError as e:
+            print(e)
+            sys.exit()
+
+    if args.daemon:
+        daemon(chans, args.transport, { "status": args.status_interval, "config": args.config_interval },
+               args.report, args.duration)
+    elif args.bench is not None:
+        pdict({ chan: transport_bench(chan, args.bench) for chan in chans })
+    elif args.user_data is not None:
+        def emit(chan:str, data:bytes, missed:int):
+            if missed > 0:
+                print("%s: %d blocks missed" % (chan, missed), file=sys.stderr)
+            print(data.hex() if len(chans) == 1 else chan + " " + data.hex())
+
+        results = user_data_channels(chans, args.user_page, args.user_data, args.transport, emit=emit)
+        for chan in chans:
+            if "error" in results[chan]:
+                print(results[chan]["error"] if len(chans) == 1 else chan + " " + results[chan]["error"])
+    elif args.cs:
+        status = channel_status(chans, args.transport)
+        pdict(status[chans[0]] if len(chans) == 1 else status)
+    elif values is not None:
+        changes = scan_channels(chans, scan=lambda chan: chan_set(chan, values, args.transport))
+        pdict(changes[chans[0]] if len(chans) == 1 else changes)
+    elif args.save is not None:
+        snaps = scan_channels(chans, scan=lambda chan: chan_snapshots(chan, args.transport, channel(chan).plan(groups)))
+        snapshots_save(args.save, { chan: snaps[chan] for chan in chans if "error" not in snaps[chan] })
+        errors = { chan: snaps[chan] for chan in chans if "error" in snaps[chan] }
+        if len(errors) > 0:
+            pdict(errors)
+    elif args.diff is not None:
+        diffs = scan_channels(chans, scan=lambda chan: chan_diff(chan, args.diff, args.transport))
+        pdict(diffs[chans[0]] if len(chans) == 1 else diffs)
+    elif query is not None and len(chans) == 1:
+        pdict(chan_scan(chans[0], args.transport, query=query))
+    elif len(chans) == 1:
+        regs = chan_scan(chans[0], args.transport, groups)
+        pdict(regs["page0"])
+        pdict(regs["page1"])
+        pdict(regs["page2"])
+    else:
+        pdict(scan_channels(chans, args.transport, groups, query))
+    if STATS is not None:
+        print(json.dumps(STATS, indent=4, default=json_default), file=sys.stderr)